@@ -5,6 +5,7 @@ A utility module for converting and formatting height values in sports roster da
 
 This package provides functions for:
 - Converting various height formats to total inches
+- Converting whole pandas Series of heights to total inches
 - Converting inches back to formatted height strings
 
 Example usage:
@@ -31,10 +32,14 @@ __license__ = "MIT"
 
 from .converter import (
     height_to_inches,
+    heights_to_inches,
+    heights_to_inches_nb,
     inches_to_height_str
 )
 
 __all__ = [
     'height_to_inches',
+    'heights_to_inches',
+    'heights_to_inches_nb',
     'inches_to_height_str',
 ]
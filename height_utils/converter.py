@@ -6,8 +6,182 @@ This module provides functions for converting various height formats
 """
 
 import re
+from functools import lru_cache
 from typing import Union, Optional
 
+import numpy as np
+import pandas as pd
+
+try:
+    # Supports possessive quantifiers on every Python version
+    import regex as _re_engine
+except ImportError:
+    _re_engine = re
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        # Fallback: run the kernel as plain Python
+        return lambda func: func
+
+
+# Prime and double prime marks are accepted as feet and inches quotes
+_QUOTE_TR = str.maketrans({'′': "'", '″': '"'})
+
+# All supported string formats as one alternation, tried left to right:
+# - Hyphen format (e.g., "5-10", "6-2")
+# - Feet with quote, optionally followed by inches (e.g., "6'2\"", "5'11", "6'")
+# - Feet with text, optionally followed by inches (e.g., "6 ft 2 in", "5 feet")
+# - Just inches with text (e.g., "72 in", "71 inches")
+_HEIGHT_RE_PATTERN = (
+    r'^(?:'
+    r'(?P<hf>\d+)\s*-\s*(?P<hi>\d+)'
+    r'|(?P<qf>\d+)\s*\'\s*(?:(?P<qi>\d+)\s*"?)?'
+    r'|(?P<tf>\d+)\s*(?:ft|feet|foot)\s*(?P<ti>\d+)?\s*(?:in|inches|inch)?'
+    r'|(?P<ii>\d+)\s*(?:in|inches|inch)\s*'
+    r')$'
+)
+
+# The same alternation with possessive quantifiers so that near-miss inputs
+# fail without backtracking. Unit alternatives are listed longest first since
+# possessive groups never go back to try a longer one.
+_HEIGHT_RE_POSSESSIVE_PATTERN = (
+    r'^(?:'
+    r'(?P<hf>\d++)\s*+-\s*+(?P<hi>\d++)'
+    r'|(?P<qf>\d++)\s*+\'\s*+(?:(?P<qi>\d++)\s*+"?+)?+'
+    r'|(?P<tf>\d++)\s*+(?:feet|foot|ft)\s*+(?P<ti>\d++)?+\s*+(?:inches|inch|in)?+'
+    r'|(?P<ii>\d++)\s*+(?:inches|inch|in)\s*+'
+    r')$'
+)
+
+try:
+    _HEIGHT_RE = _re_engine.compile(_HEIGHT_RE_POSSESSIVE_PATTERN, _re_engine.IGNORECASE)
+except re.error:
+    # The built-in re module only supports possessive quantifiers from Python 3.11
+    _HEIGHT_RE = re.compile(_HEIGHT_RE_PATTERN, re.IGNORECASE)
+
+
+def _parse_common_height(height_str: str) -> Optional[int]:
+    """
+    Parse the common "F-I", "F-II", "F'I" and "F'II\"" shapes without regex.
+
+    Returns None when height_str is not one of these shapes, in which case the
+    caller falls back to the full regex parse.
+    """
+    length = len(height_str)
+    if length < 3 or length > 5:
+        return None
+
+    sep = height_str[1]
+    if sep == "'":
+        end = length - 1 if height_str[-1] == '"' else length
+    elif sep == '-':
+        end = length
+    else:
+        return None
+
+    feet = ord(height_str[0]) - 48
+    if not 0 <= feet <= 9:
+        return None
+
+    if end == 3:
+        inches = ord(height_str[2]) - 48
+        if not 0 <= inches <= 9:
+            return None
+    elif end == 4:
+        tens = ord(height_str[2]) - 48
+        ones = ord(height_str[3]) - 48
+        if not (0 <= tens <= 9 and 0 <= ones <= 9):
+            return None
+        inches = tens * 10 + ones
+    else:
+        return None
+
+    return feet * 12 + inches
+
+
+def _parse_hyphen(height_str: str) -> Optional[int]:
+    """
+    Parse "F-I" with optional spaces around the hyphen, or return None.
+    """
+    feet, _, inches = height_str.partition('-')
+    feet = feet.rstrip()
+    inches = inches.lstrip()
+    if feet.isdecimal() and inches.isdecimal():
+        return int(feet) * 12 + int(inches)
+    return None
+
+
+def _parse_quote(height_str: str) -> Optional[int]:
+    """
+    Parse "F'", "F'I" or "F'I\"" with optional spaces, or return None.
+    """
+    feet, _, inches = height_str.partition("'")
+    feet = feet.rstrip()
+    inches = inches.strip()
+    if not feet.isdecimal():
+        return None
+    if not inches:
+        return int(feet) * 12
+    if inches[-1] == '"':
+        inches = inches[:-1].rstrip()
+    if inches.isdecimal():
+        return int(feet) * 12 + int(inches)
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _height_str_to_inches(height_str: str) -> Optional[int]:
+    """
+    Parse a stripped height string to total inches.
+
+    Rosters repeat a few dozen distinct height strings, so results are cached.
+    """
+    if not height_str:
+        return None
+
+    # Fold smart quotes into ASCII so every parser below only sees ' and "
+    height_str = height_str.translate(_QUOTE_TR)
+
+    # Fast path for the vast majority of roster values ("5-10", "6'2\"")
+    inches = _parse_common_height(height_str)
+    if inches is not None:
+        return inches
+
+    # Dispatch on the separator before falling back to the general parse
+    if '-' in height_str:
+        inches = _parse_hyphen(height_str)
+    elif "'" in height_str:
+        inches = _parse_quote(height_str)
+    if inches is not None:
+        return inches
+
+    # Try to parse as a plain number (total inches)
+    try:
+        return int(round(float(height_str)))
+    except ValueError:
+        pass
+
+    match = _HEIGHT_RE.match(height_str)
+    if not match:
+        return None
+
+    if match.group('hf') is not None:
+        feet, inches = match.group('hf', 'hi')
+    elif match.group('qf') is not None:
+        feet, inches = match.group('qf', 'qi')
+    elif match.group('tf') is not None:
+        feet, inches = match.group('tf', 'ti')
+    else:
+        return int(match.group('ii'))
+
+    return int(feet) * 12 + (int(inches) if inches else 0)
+
 
 def height_to_inches(height: Union[str, int, float]) -> Optional[int]:
     """
@@ -47,70 +221,121 @@ def height_to_inches(height: Union[str, int, float]) -> Optional[int]:
     if isinstance(height, (int, float)):
         return int(round(height))
 
-    # Convert to string and strip whitespace
-    height_str = str(height).strip()
+    # Convert to string and strip whitespace, then parse (cached per string)
+    return _height_str_to_inches(str(height).strip())
 
-    if not height_str:
-        return None
 
-    # Try to parse as a plain number (total inches)
-    try:
-        return int(round(float(height_str)))
-    except ValueError:
-        pass
+def heights_to_inches(heights: pd.Series) -> pd.Series:
+    """
+    Convert a Series of height values to total inches in one vectorized pass.
 
-    # Pattern 1: Hyphen format (e.g., "5-10", "6-2")
-    hyphen_match = re.match(r'^(\d+)\s*-\s*(\d+)$', height_str)
-    if hyphen_match:
-        feet = int(hyphen_match.group(1))
-        inches = int(hyphen_match.group(2))
-        return feet * 12 + inches
-
-    # Pattern 2: Feet/inches with quotes (e.g., "6'2\"", "5'11", "6'2")
-    quote_match = re.match(r'^(\d+)\s*[\'′]\s*(\d+)\s*[\"″]?$', height_str)
-    if quote_match:
-        feet = int(quote_match.group(1))
-        inches = int(quote_match.group(2))
-        return feet * 12 + inches
-
-    # Pattern 3: Just feet with quote (e.g., "6'", "5'")
-    feet_only_match = re.match(r'^(\d+)\s*[\'′]\s*$', height_str)
-    if feet_only_match:
-        feet = int(feet_only_match.group(1))
-        return feet * 12
-
-    # Pattern 4: Feet/inches with text (e.g., "6 ft 2 in", "5 feet 11 inches")
-    text_match = re.match(
-        r'^(\d+)\s*(?:ft|feet|foot)\s*(\d+)?\s*(?:in|inches|inch)?$',
-        height_str,
-        re.IGNORECASE
-    )
-    if text_match:
-        feet = int(text_match.group(1))
-        inches = int(text_match.group(2)) if text_match.group(2) else 0
-        return feet * 12 + inches
-
-    # Pattern 5: Just feet with text (e.g., "6 ft", "5 feet")
-    feet_text_only_match = re.match(
-        r'^(\d+)\s*(?:ft|feet|foot)\s*$',
-        height_str,
-        re.IGNORECASE
-    )
-    if feet_text_only_match:
-        feet = int(feet_text_only_match.group(1))
-        return feet * 12
-
-    # Pattern 6: Just inches with text (e.g., "72 in", "71 inches")
-    inches_only_match = re.match(
-        r'^(\d+)\s*(?:in|inches|inch)\s*$',
-        height_str,
-        re.IGNORECASE
-    )
-    if inches_only_match:
-        return int(inches_only_match.group(1))
-
-    # If no pattern matched, return None
-    return None
+    This is the column-level counterpart of height_to_inches() and accepts the
+    same formats. Prefer it over heights.apply(height_to_inches) for large
+    roster DataFrames.
+
+    Args:
+        heights: Series of height values in various formats (strings, ints, or floats)
+
+    Returns:
+        Series of total inches with the nullable "Int64" dtype and the same index
+        as the input; values that cannot be parsed are <NA>
+
+    Examples:
+        >>> import pandas as pd
+        >>> heights_to_inches(pd.Series(["5-10", "6'2\"", "5 ft 11 in", 72, "invalid"])).tolist()
+        [70, 74, 71, 72, <NA>]
+    """
+    heights = pd.Series(heights)
+
+    # Plain numbers (and numeric strings) are total inches
+    numeric = pd.to_numeric(heights, errors='coerce')
+    numeric = numeric.round()
+
+    parts = heights.astype(str).str.strip().str.translate(_QUOTE_TR).str.extract(_HEIGHT_RE_PATTERN, flags=re.IGNORECASE)
+    parts = parts.apply(pd.to_numeric, errors='coerce')
+
+    # Only one branch of the alternation can match, so the others are NaN
+    feet = parts['hf'].combine_first(parts['qf']).combine_first(parts['tf'])
+    inches = parts['hi'].combine_first(parts['qi']).combine_first(parts['ti']).fillna(0)
+    parsed = (feet * 12 + inches).combine_first(parts['ii'])
+
+    inches_total = numeric.combine_first(parsed)
+
+    # Infinite or absurdly large values have no integer representation
+    return inches_total.where(inches_total.abs() < 2 ** 63).astype('Int64')
+
+
+@njit(parallel=True, cache=True)
+def _parse_fixed_heights(buf, out):
+    # buf is an (n, width) uint8 view of null-padded ASCII strings; 48-57 are
+    # the digits '0'-'9' and 45 is '-'
+    n, width = buf.shape
+    for row in prange(n):
+        length = 0
+        while length < width and buf[row, length] != 0:
+            length += 1
+
+        if length >= 3 and buf[row, 1] == 45:  # "N-N" or "N-NN"
+            digits_start = 2
+            valid = length <= 4 and 48 <= buf[row, 0] <= 57
+        else:  # "NN" total inches
+            digits_start = 0
+            valid = 1 <= length <= 3
+
+        value = 0
+        for i in range(digits_start, length):
+            char = int(buf[row, i])
+            if char < 48 or char > 57:
+                valid = False
+                break
+            value = value * 10 + (char - 48)
+
+        if valid and digits_start:
+            value += (int(buf[row, 0]) - 48) * 12
+
+        out[row] = value if valid and value <= 127 else -1
+
+
+def heights_to_inches_nb(heights: np.ndarray) -> np.ndarray:
+    """
+    Convert an array of pre-normalized height strings to total inches.
+
+    A fast path for columns already cleaned to the "NN" (total inches) or
+    "N-NN" (feet-inches) shapes, e.g. from Series.astype('|S8').to_numpy().
+    Parsing runs in a parallel numba kernel when numba is installed and
+    falls back to plain Python otherwise. Any other shape, including extra
+    whitespace, is treated as invalid; use heights_to_inches() for messy data.
+
+    Args:
+        heights: Array of ASCII byte strings (dtype "S")
+
+    Returns:
+        np.int8 array of total inches, with -1 for invalid values
+
+    Examples:
+        >>> import numpy as np
+        >>> heights_to_inches_nb(np.array([b"5-10", b"72", b"6'2"]))
+        array([70, 72, -1], dtype=int8)
+    """
+    heights = np.ascontiguousarray(heights, dtype=np.bytes_)
+    buf = heights.view(np.uint8).reshape(len(heights), heights.dtype.itemsize)
+    out = np.empty(len(heights), dtype=np.int8)
+    _parse_fixed_heights(buf, out)
+    return out
+
+
+_HEIGHT_STR_FORMATS = {
+    'hyphen': "{}-{}",
+    'quote': "{}'{}\"",
+    'text': "{} ft {} in",
+}
+
+# Precomputed strings for every realistic height (0 to 8'11")
+_HEIGHT_STR_TABLE_SIZE = 108
+_HEIGHT_STR_TABLES = {
+    name: tuple(template.format(i // 12, i % 12) for i in range(_HEIGHT_STR_TABLE_SIZE))
+    for name, template in _HEIGHT_STR_FORMATS.items()
+}
 
 
 def inches_to_height_str(inches: Union[int, float], format: str = "hyphen") -> Optional[str]:
@@ -135,15 +360,12 @@ def inches_to_height_str(inches: Union[int, float], format: str = "hyphen") -> O
     if inches is None or inches < 0:
         return None
 
-    total_inches = int(round(inches))
-    feet = total_inches // 12
-    remaining_inches = total_inches % 12
-
-    if format == "hyphen":
-        return f"{feet}-{remaining_inches}"
-    elif format == "quote":
-        return f"{feet}'{remaining_inches}\""
-    elif format == "text":
-        return f"{feet} ft {remaining_inches} in"
-    else:
+    template = _HEIGHT_STR_FORMATS.get(format)
+    if template is None:
         raise ValueError(f"Invalid format: {format}. Must be 'hyphen', 'quote', or 'text'")
+
+    total_inches = int(round(inches))
+    if total_inches < _HEIGHT_STR_TABLE_SIZE:
+        return _HEIGHT_STR_TABLES[format][total_inches]
+
+    return template.format(total_inches // 12, total_inches % 12)
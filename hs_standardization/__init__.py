@@ -44,11 +44,14 @@ __license__ = "MIT"
 # Import main functions for easy access
 from .normalize import (
     normalize_hs_name,
+    normalize_hs_name_series,
     extract_disambiguator,
     categorize_school_type,
+    categorize_school_type_series,
     is_likely_common_name,
     is_international_school,
-    standardize_suffix
+    standardize_suffix,
+    standardize_suffix_from_base
 )
 
 from .mapping import (
@@ -69,17 +72,22 @@ from .nces_data import (
     match_to_nces,
     batch_match_to_nces,
     get_nces_standardized_name,
-    create_nces_lookup
+    create_nces_lookup,
+    NCESLookup,
+    NCESRecord
 )
 
 __all__ = [
     # Normalization functions
     'normalize_hs_name',
+    'normalize_hs_name_series',
     'extract_disambiguator',
     'categorize_school_type',
+    'categorize_school_type_series',
     'is_likely_common_name',
     'is_international_school',
     'standardize_suffix',
+    'standardize_suffix_from_base',
 
     # Mapping functions
     'select_canonical_name',
@@ -99,4 +107,6 @@ __all__ = [
     'batch_match_to_nces',
     'get_nces_standardized_name',
     'create_nces_lookup',
+    'NCESLookup',
+    'NCESRecord',
 ]
@@ -7,10 +7,72 @@ duplicate high school names and selecting canonical names.
 Extracted from the womens-college-basketball project.
 """
 
+from collections import namedtuple
+
+import numpy as np
 import pandas as pd
 from .normalize import normalize_hs_name
 
 
+def _score_name(name):
+    """
+    Score a name's suffix style; "H.S." is preferred to avoid confusion with colleges.
+    """
+    if not isinstance(name, str):
+        name = str(name)
+
+    if 'H.S.' in name:
+        return 100
+    elif 'High School' in name:
+        return 90
+    elif ' HS' in name:
+        return 80
+    return 0
+
+
+def _score_names(names):
+    """
+    Vectorized _score_name() for a Series of names.
+    """
+    names = names.astype(str)
+    return pd.Series(np.select(
+        [
+            names.str.contains('H.S.', regex=False),
+            names.str.contains('High School', regex=False),
+            names.str.contains(' HS', regex=False),
+        ],
+        [100, 90, 80],
+        default=0
+    ), index=names.index)
+
+
+# Lightweight canonical-candidate record used instead of pandas rows; row is
+# the candidate's position in the group
+_Canon = namedtuple('_Canon', 'name player_count row')
+
+
+def _select_canonical(items):
+    """
+    Select the canonical candidate from a group of duplicates.
+
+    This is the plain-Python core of select_canonical_name(), used to avoid
+    building and sorting a DataFrame for every duplicate group.
+
+    Args:
+        items (list): _Canon records, one per variant
+
+    Returns:
+        _Canon: The record to use as the canonical name
+    """
+    max_count = max(item.player_count for item in items)
+    top_candidates = [item for item in items if item.player_count == max_count]
+
+    if len(top_candidates) == 1:
+        return top_candidates[0]
+
+    return min(top_candidates, key=lambda item: (-_score_name(item.name), item.name))
+
+
 def select_canonical_name(group_df):
     """
     Given a group of duplicate high school names, select the canonical one.
@@ -39,31 +101,13 @@ def select_canonical_name(group_df):
         >>> canonical['high_school_original']
         'Central High School'
     """
-    # Start with most common
-    group_df = group_df.sort_values('player_count', ascending=False)
-
-    max_count = group_df.iloc[0]['player_count']
-    top_candidates = group_df[group_df['player_count'] == max_count].copy()
-
-    if len(top_candidates) == 1:
-        return top_candidates.iloc[0]
-
-    # Prefer "H.S." suffix to avoid confusion with colleges
-    def score_name(name):
-        score = 0
-        if 'H.S.' in str(name):
-            score += 100
-        elif 'High School' in str(name):
-            score += 90
-        elif ' HS' in str(name):
-            score += 80
-        return score
-
-    top_candidates['name_score'] = top_candidates['high_school_original'].apply(score_name)
-    top_candidates = top_candidates.sort_values(['name_score', 'high_school_original'],
-                                                  ascending=[False, True])
-
-    return top_candidates.iloc[0]
+    items = [
+        _Canon(name, count, row)
+        for row, (name, count) in enumerate(
+            zip(group_df['high_school_original'], group_df['player_count'])
+        )
+    ]
+    return group_df.iloc[_select_canonical(items).row]
 
 
 def create_duplicate_mapping(schools_df, group_by_state=True):
@@ -111,42 +155,107 @@ def create_duplicate_mapping(schools_df, group_by_state=True):
     if group_by_state and 'state' in schools_df.columns:
         group_cols.append('state')
 
-    mappings = []
-
-    for group_key, group in schools_df.groupby(group_cols):
-        if len(group) == 1:
-            # Not a duplicate, but still add to mapping for completeness
-            row = group.iloc[0]
-            mappings.append({
-                'high_school_original': row['high_school_original'],
-                'high_school_standardized': row['high_school_original'],
-                'state': row.get('state', ''),
-                'confidence': 'high_auto',
-                'source': 'no_variation',
-                'player_count': row.get('player_count', 1),
-                'canonical_player_count': row.get('player_count', 1)
-            })
-            continue
-
-        # Select canonical name for duplicates
-        canonical = select_canonical_name(group)
-
-        # Create mappings for all variations
-        state = group_key[1] if isinstance(group_key, tuple) and len(group_key) > 1 else ''
-
-        for _, row in group.iterrows():
-            mappings.append({
-                'high_school_original': row['high_school_original'],
-                'high_school_standardized': canonical['high_school_original'],
-                'state': state if state else row.get('state', ''),
-                'confidence': 'high_auto',
-                'source': 'duplicate_resolution',
-                'player_count': row.get('player_count', 1),
-                'canonical_player_count': canonical.get('player_count', 1)
-            })
-
-    mapping_df = pd.DataFrame(mappings)
-    return mapping_df
+    # groupby() skips rows with missing keys, so they get no mapping either
+    schools_df = schools_df.dropna(subset=group_cols)
+
+    n = len(schools_df)
+    originals = schools_df['high_school_original'].to_numpy(dtype=object)
+    if 'state' in schools_df.columns:
+        states = schools_df['state'].to_numpy(dtype=object)
+    else:
+        states = np.full(n, '', dtype=object)
+    if 'player_count' in schools_df.columns:
+        counts = schools_df['player_count'].to_numpy()
+    else:
+        counts = np.ones(n, dtype=np.int64)
+
+    group_ids = schools_df.groupby(group_cols).ngroup().to_numpy()
+    group_sizes = np.bincount(group_ids)
+    has_variants = group_sizes[group_ids] > 1
+
+    # Most schools appear once and are trivially their own canonical name
+    canonical_rows = np.empty(len(group_sizes), dtype=np.intp)
+    singles = np.flatnonzero(~has_variants)
+    canonical_rows[group_ids[singles]] = singles
+
+    # Rank variants within the remaining groups so the first one is the
+    # canonical name (same preference order as select_canonical_name)
+    multis = np.flatnonzero(has_variants)
+    ranked = pd.DataFrame({
+        'group': group_ids[multis],
+        'player_count': counts[multis],
+        'name_score': _score_names(pd.Series(originals[multis])).to_numpy(),
+        'name': originals[multis],
+    }, index=multis).sort_values(
+        ['group', 'player_count', 'name_score', 'name'],
+        ascending=[True, False, False, True]
+    ).drop_duplicates('group')
+    canonical_rows[ranked['group'].to_numpy()] = ranked.index.to_numpy()
+
+    # Emit rows in grouped order: by group key, then by original row order
+    order = np.argsort(group_ids, kind='stable')
+    canonical = canonical_rows[group_ids[order]]
+
+    return pd.DataFrame({
+        'high_school_original': originals[order],
+        'high_school_standardized': originals[canonical],
+        'state': states[order],
+        'confidence': 'high_auto',
+        'source': np.where(has_variants[order], 'duplicate_resolution', 'no_variation'),
+        'player_count': counts[order],
+        'canonical_player_count': counts[canonical],
+    })
+
+
+# Well-known basketball prep schools and academies
+_PREP_SCHOOLS = (
+    {'original': 'IMG Academy', 'standardized': 'IMG Academy', 'city': 'Bradenton', 'state': 'FL'},
+    {'original': 'Montverde Academy', 'standardized': 'Montverde Academy', 'city': 'Montverde', 'state': 'FL'},
+    {'original': 'Oak Hill Academy', 'standardized': 'Oak Hill Academy', 'city': 'Mouth of Wilson', 'state': 'VA'},
+    {'original': 'Brewster Academy', 'standardized': 'Brewster Academy', 'city': 'Wolfeboro', 'state': 'NH'},
+    {'original': 'Prolific Prep', 'standardized': 'Prolific Prep', 'city': 'Napa', 'state': 'CA'},
+    {'original': 'Spire Academy', 'standardized': 'Spire Institute', 'city': 'Geneva', 'state': 'OH'},
+    {'original': 'Spire Institute', 'standardized': 'Spire Institute', 'city': 'Geneva', 'state': 'OH'},
+    {'original': 'Link Academy', 'standardized': 'Link Academy', 'city': 'Branson', 'state': 'MO'},
+    {'original': 'La Lumiere School', 'standardized': 'La Lumiere School', 'city': 'La Porte', 'state': 'IN'},
+    {'original': 'New Hope Academy', 'standardized': 'New Hope Christian Academy', 'city': 'Landover Hills', 'state': 'MD'},
+    {'original': 'New Hope Christian Academy', 'standardized': 'New Hope Christian Academy', 'city': 'Landover Hills', 'state': 'MD'},
+    {'original': 'Hamilton Heights Christian Academy', 'standardized': 'Hamilton Heights Christian Academy', 'city': 'Chattanooga', 'state': 'TN'},
+    {'original': 'Northfield Mount Hermon', 'standardized': 'Northfield Mount Hermon School', 'city': 'Gill', 'state': 'MA'},
+    {'original': 'Northfield Mount Hermon School', 'standardized': 'Northfield Mount Hermon School', 'city': 'Gill', 'state': 'MA'},
+    {'original': 'South Kent School', 'standardized': 'South Kent School', 'city': 'South Kent', 'state': 'CT'},
+    {'original': 'Wilbraham & Monson Academy', 'standardized': 'Wilbraham & Monson Academy', 'city': 'Wilbraham', 'state': 'MA'},
+    {'original': 'Westtown School', 'standardized': 'Westtown School', 'city': 'West Chester', 'state': 'PA'},
+    {'original': 'Worcester Academy', 'standardized': 'Worcester Academy', 'city': 'Worcester', 'state': 'MA'},
+    {'original': "The Governor's Academy", 'standardized': "The Governor's Academy", 'city': 'Byfield', 'state': 'MA'},
+    {'original': 'Governors Academy', 'standardized': "The Governor's Academy", 'city': 'Byfield', 'state': 'MA'},
+    {'original': 'Blair Academy', 'standardized': 'Blair Academy', 'city': 'Blairstown', 'state': 'NJ'},
+    {'original': 'Putnam Science Academy', 'standardized': 'Putnam Science Academy', 'city': 'Putnam', 'state': 'CT'},
+    {'original': "St. Andrew's School", 'standardized': "St. Andrew's School", 'city': 'Barrington', 'state': 'RI'},
+    {'original': 'Tabor Academy', 'standardized': 'Tabor Academy', 'city': 'Marion', 'state': 'MA'},
+    {'original': 'Choate Rosemary Hall', 'standardized': 'Choate Rosemary Hall', 'city': 'Wallingford', 'state': 'CT'},
+)
+
+
+def _build_prep_school_mapping():
+    mapping_records = []
+    for school in _PREP_SCHOOLS:
+        mapping_records.append({
+            'high_school_original': school['original'],
+            'high_school_standardized': school['standardized'],
+            'state': school['state'],
+            'city': school.get('city', ''),
+            'confidence': 'high_manual',
+            'source': 'prep_school_curated',
+            'notes': 'Manually curated prep/basketball academy'
+        })
+
+    return pd.DataFrame(mapping_records)
+
+
+# Built once at import; create_prep_school_mapping() hands out copies
+_PREP_MAPPING_DF = _build_prep_school_mapping()
+_PREP_ORIGINALS = frozenset(school['original'] for school in _PREP_SCHOOLS)
 
 
 def create_prep_school_mapping():
@@ -156,6 +265,9 @@ def create_prep_school_mapping():
     These schools often won't be in public school databases (like NCES) and need
     manual curation. This includes variations of the same school name.
 
+    The mapping is built once at import; each call returns a fresh copy that is
+    safe to modify.
+
     Returns:
         pd.DataFrame: Mapping with columns:
             - high_school_original: Original/variant name
@@ -172,54 +284,14 @@ def create_prep_school_mapping():
         >>> len(img)
         1
     """
-    # Well-known basketball prep schools and academies
-    prep_schools = [
-        {'original': 'IMG Academy', 'standardized': 'IMG Academy', 'city': 'Bradenton', 'state': 'FL'},
-        {'original': 'Montverde Academy', 'standardized': 'Montverde Academy', 'city': 'Montverde', 'state': 'FL'},
-        {'original': 'Oak Hill Academy', 'standardized': 'Oak Hill Academy', 'city': 'Mouth of Wilson', 'state': 'VA'},
-        {'original': 'Brewster Academy', 'standardized': 'Brewster Academy', 'city': 'Wolfeboro', 'state': 'NH'},
-        {'original': 'Prolific Prep', 'standardized': 'Prolific Prep', 'city': 'Napa', 'state': 'CA'},
-        {'original': 'Spire Academy', 'standardized': 'Spire Institute', 'city': 'Geneva', 'state': 'OH'},
-        {'original': 'Spire Institute', 'standardized': 'Spire Institute', 'city': 'Geneva', 'state': 'OH'},
-        {'original': 'Link Academy', 'standardized': 'Link Academy', 'city': 'Branson', 'state': 'MO'},
-        {'original': 'La Lumiere School', 'standardized': 'La Lumiere School', 'city': 'La Porte', 'state': 'IN'},
-        {'original': 'New Hope Academy', 'standardized': 'New Hope Christian Academy', 'city': 'Landover Hills', 'state': 'MD'},
-        {'original': 'New Hope Christian Academy', 'standardized': 'New Hope Christian Academy', 'city': 'Landover Hills', 'state': 'MD'},
-        {'original': 'Hamilton Heights Christian Academy', 'standardized': 'Hamilton Heights Christian Academy', 'city': 'Chattanooga', 'state': 'TN'},
-        {'original': 'Northfield Mount Hermon', 'standardized': 'Northfield Mount Hermon School', 'city': 'Gill', 'state': 'MA'},
-        {'original': 'Northfield Mount Hermon School', 'standardized': 'Northfield Mount Hermon School', 'city': 'Gill', 'state': 'MA'},
-        {'original': 'South Kent School', 'standardized': 'South Kent School', 'city': 'South Kent', 'state': 'CT'},
-        {'original': 'Wilbraham & Monson Academy', 'standardized': 'Wilbraham & Monson Academy', 'city': 'Wilbraham', 'state': 'MA'},
-        {'original': 'Westtown School', 'standardized': 'Westtown School', 'city': 'West Chester', 'state': 'PA'},
-        {'original': 'Worcester Academy', 'standardized': 'Worcester Academy', 'city': 'Worcester', 'state': 'MA'},
-        {'original': "The Governor's Academy", 'standardized': "The Governor's Academy", 'city': 'Byfield', 'state': 'MA'},
-        {'original': 'Governors Academy', 'standardized': "The Governor's Academy", 'city': 'Byfield', 'state': 'MA'},
-        {'original': 'Blair Academy', 'standardized': 'Blair Academy', 'city': 'Blairstown', 'state': 'NJ'},
-        {'original': 'Putnam Science Academy', 'standardized': 'Putnam Science Academy', 'city': 'Putnam', 'state': 'CT'},
-        {'original': "St. Andrew's School", 'standardized': "St. Andrew's School", 'city': 'Barrington', 'state': 'RI'},
-        {'original': 'Tabor Academy', 'standardized': 'Tabor Academy', 'city': 'Marion', 'state': 'MA'},
-        {'original': 'Choate Rosemary Hall', 'standardized': 'Choate Rosemary Hall', 'city': 'Wallingford', 'state': 'CT'},
-    ]
-
-    mapping_records = []
-    for school in prep_schools:
-        mapping_records.append({
-            'high_school_original': school['original'],
-            'high_school_standardized': school['standardized'],
-            'state': school['state'],
-            'city': school.get('city', ''),
-            'confidence': 'high_manual',
-            'source': 'prep_school_curated',
-            'notes': 'Manually curated prep/basketball academy'
-        })
-
-    return pd.DataFrame(mapping_records)
+    return _PREP_MAPPING_DF.copy()
 
 
 def apply_mapping(df, mapping_df, original_col='high_school',
                   standardized_col='high_school_standardized',
                   confidence_col='hs_confidence',
-                  changed_col='hs_was_standardized'):
+                  changed_col='hs_was_standardized',
+                  inplace=False):
     """
     Apply a standardization mapping to a DataFrame.
 
@@ -233,9 +305,13 @@ def apply_mapping(df, mapping_df, original_col='high_school',
         standardized_col (str): Name for new column with standardized names
         confidence_col (str): Name for new column with confidence levels
         changed_col (str): Name for new column indicating if name changed
+        inplace (bool): If True, add the new columns to df itself instead of to a
+            shallow copy (default: False)
 
     Returns:
-        pd.DataFrame: Original DataFrame with new columns added
+        pd.DataFrame: DataFrame with new columns added. Unless inplace=True this
+            is a shallow copy: it shares the existing column data with df, but
+            adding the new columns does not modify df.
 
     Examples:
         >>> import pandas as pd
@@ -249,25 +325,35 @@ def apply_mapping(df, mapping_df, original_col='high_school',
         >>> result[standardized_col].tolist()
         ['Central High School', 'Lincoln High School']
     """
-    # Create lookup dictionary
-    mapping_dict = dict(zip(
-        mapping_df['high_school_original'],
-        mapping_df['high_school_standardized']
-    ))
-
-    confidence_dict = {}
-    if 'confidence' in mapping_df.columns:
-        confidence_dict = dict(zip(
-            mapping_df['high_school_original'],
-            mapping_df['confidence']
-        ))
+    # Index the mapping by original name (later rows win, as with a dict)
+    lookup = mapping_df.dropna(subset=['high_school_original']).drop_duplicates(
+        subset=['high_school_original'], keep='last'
+    )
+
+    # Resolve every row to its position in the lookup with one hash join;
+    # unmapped names get code -1
+    codes = pd.Index(lookup['high_school_original']).get_indexer(df[original_col])
+    matched = codes >= 0
+
+    def lookup_values(column, fallback):
+        # Take lookup[column] for matched rows, keeping fallback elsewhere
+        values = fallback.copy()
+        values[matched] = lookup[column].to_numpy(dtype=object)[codes[matched]]
+        missing = pd.isna(values)
+        values[missing] = fallback[missing]
+        return pd.Series(values, index=df.index).infer_objects()
 
     # Apply mapping
-    df = df.copy()
-    df[standardized_col] = df[original_col].map(mapping_dict).fillna(df[original_col])
-
-    if confidence_dict:
-        df[confidence_col] = df[original_col].map(confidence_dict).fillna('unstandardized')
+    if not inplace:
+        df = df.copy(deep=False)
+    df[standardized_col] = lookup_values(
+        'high_school_standardized', df[original_col].to_numpy(dtype=object)
+    )
+
+    if 'confidence' in lookup.columns and len(lookup):
+        df[confidence_col] = lookup_values(
+            'confidence', np.full(len(df), 'unstandardized', dtype=object)
+        )
 
     df[changed_col] = df[original_col] != df[standardized_col]
 
@@ -306,17 +392,14 @@ def build_complete_mapping(schools_df, include_prep_schools=True, group_by_state
     duplicate_mapping = create_duplicate_mapping(schools_df, group_by_state=group_by_state)
 
     if include_prep_schools:
-        # Add prep school mapping
-        prep_mapping = create_prep_school_mapping()
-
-        # Combine mappings
-        all_mappings = pd.concat([duplicate_mapping, prep_mapping], ignore_index=True)
-
-        # Remove exact duplicates (keep prep school version if both exist)
-        all_mappings = all_mappings.drop_duplicates(
-            subset=['high_school_original'],
-            keep='last'  # Keep prep school mapping if duplicate
-        )
+        # Prep school mappings take precedence, so drop any duplicate-resolution
+        # rows they cover with one set probe instead of deduplicating the union
+        duplicate_mapping = duplicate_mapping[
+            ~duplicate_mapping['high_school_original'].isin(_PREP_ORIGINALS)
+        ].drop_duplicates(subset=['high_school_original'], keep='last')
+
+        # Combine mappings (concat copies, so the shared prep frame is safe to use)
+        all_mappings = pd.concat([duplicate_mapping, _PREP_MAPPING_DF], ignore_index=True)
     else:
         all_mappings = duplicate_mapping
 
@@ -16,17 +16,70 @@ References:
 - PSS: https://nces.ed.gov/surveys/pss/pssdata.asp
 """
 
+import codecs
+import hashlib
 import os
+import pickle
+import numpy as np
 import pandas as pd
 import re
+from collections.abc import Mapping
+from dataclasses import dataclass, field as dc_field
 from pathlib import Path
-from typing import Optional, Tuple, List, Dict
-from .normalize import normalize_hs_name
+from typing import Optional, Tuple, List, Dict, NamedTuple
+from . import __version__
+from .normalize import normalize_hs_name, normalize_hs_name_series, standardize_suffix_from_base
+
+try:
+    # Multithreaded CSV parsing and the Parquet engine for the prepared data cache
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 
 # Default data directory
 DEFAULT_DATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'data', 'nces')
 
+# Columns read from the NCES files: the key fields from the download
+# instructions plus every known name of the level column
+_CCD_LEVEL_COLUMNS = ['LEVEL', 'SCH_LEVEL', 'SCHOOL_LEVEL']
+_CCD_COLUMNS = frozenset([
+    'NCESSCH', 'SCH_NAME', 'LSTREET1', 'LSTREET2', 'LSTREET3', 'LCITY',
+    'LSTATE', 'LZIP', 'PHONE', 'SCHOOL_TYPE_TEXT', *_CCD_LEVEL_COLUMNS
+])
+_PSS_LEVEL_COLUMNS = ['LEVEL', 'LEVEL12', 'LEVEL_CODE']
+_PSS_COLUMNS = frozenset([
+    'PPIN', 'PINST', 'PADDRS', 'PCITY', 'PSTATE', 'PZIP', 'AFFIL', *_PSS_LEVEL_COLUMNS
+])
+
+# LEVEL values kept when loading high schools only: the CCD code for high
+# schools, and the PSS codes/labels for schools serving high school grades
+_CCD_HIGH_SCHOOL_LEVEL = 3
+_PSS_HIGH_SCHOOL_LEVEL_RE = re.compile(r'3|4|HS|HIGH', re.IGNORECASE)
+
+# Rows parsed at a time when loading the NCES files
+_CSV_CHUNK_SIZE = 50_000
+
+# Bytes read to detect the encoding of an NCES file, and detected encodings
+# by (path, modification time)
+_ENCODING_SNIFF_BYTES = 64 * 1024
+_ENCODING_CACHE: Dict[Tuple[str, float], str] = {}
+
+# Parse-time dtypes: IDs stay strings (NCES IDs have leading zeros) and the
+# heavily repeated city/state values are stored as categories
+_CCD_DTYPES = {'NCESSCH': str, 'LCITY': 'category', 'LSTATE': 'category'}
+_PSS_DTYPES = {'PPIN': str, 'PCITY': 'category', 'PSTATE': 'category'}
+
+# Prepared columns with few distinct values, stored as categories
+_CATEGORY_COLUMNS = ['city', 'state', 'source']
+
+# Version of the prepared data layout. Bump it whenever
+# prepare_nces_for_matching() or the loaders change what they produce, so
+# caches written by earlier code are rebuilt.
+_PREPARED_CACHE_VERSION = 1
+
 
 def get_data_directory(data_dir: Optional[str] = None) -> Path:
     """
@@ -189,12 +242,149 @@ def find_latest_pss_file(data_dir: Optional[str] = None) -> Optional[Path]:
     return pss_files[0]
 
 
+def _ccd_high_school_mask(df: pd.DataFrame) -> pd.Series:
+    """
+    Flag CCD high schools (level 3).
+    """
+    # LEVEL column: 1=Primary, 2=Middle, 3=High, 4=Other/Alternative
+    # Some files may have different column names for level
+    for col in _CCD_LEVEL_COLUMNS:
+        if col in df.columns:
+            # Compare the code as a number; a substring test would also match e.g. 13
+            return pd.to_numeric(df[col], errors='coerce') == _CCD_HIGH_SCHOOL_LEVEL
+    return pd.Series(True, index=df.index)
+
+
+def _pss_high_school_mask(df: pd.DataFrame) -> pd.Series:
+    """
+    Flag PSS schools that serve high school grades.
+    """
+    # PSS LEVEL encoding may vary by year, but typically includes high school codes
+    # This typically means having grades 9-12
+    for col in _PSS_LEVEL_COLUMNS:
+        if col in df.columns:
+            return df[col].astype(str).str.contains(_PSS_HIGH_SCHOOL_LEVEL_RE, na=False)
+    return pd.Series(True, index=df.index)
+
+
+def _encoding_cache_key(file_path) -> Tuple[str, float]:
+    return os.fspath(file_path), os.path.getmtime(file_path)
+
+
+def _detect_encoding(file_path) -> str:
+    """
+    Pick the encoding of an NCES CSV file from its first 64KB.
+
+    NCES files are either UTF-8 or latin1. The result is cached per path and
+    modification time, so repeated loads of the same file skip the sniff.
+    """
+    key = _encoding_cache_key(file_path)
+    encoding = _ENCODING_CACHE.get(key)
+    if encoding is None:
+        with open(file_path, 'rb') as f:
+            head = f.read(_ENCODING_SNIFF_BYTES)
+        try:
+            # Incremental so that a character cut off at the end still counts as UTF-8
+            codecs.getincrementaldecoder('utf-8')().decode(head, final=False)
+            encoding = 'utf-8'
+        except UnicodeDecodeError:
+            encoding = 'latin1'
+        _ENCODING_CACHE[key] = encoding
+    return encoding
+
+
+def _read_nces_csv(file_path, columns: frozenset, dtypes: Dict, row_mask=None) -> pd.DataFrame:
+    """
+    Read an NCES CSV file in the encoding detected from its head.
+    """
+    encoding = _detect_encoding(file_path)
+    try:
+        return _parse_nces_csv(file_path, encoding, columns, dtypes, row_mask)
+    except UnicodeDecodeError:
+        # Non-UTF-8 bytes past the sniffed head; latin1 decodes any byte
+        _ENCODING_CACHE[_encoding_cache_key(file_path)] = 'latin1'
+        return _parse_nces_csv(file_path, 'latin1', columns, dtypes, row_mask)
+
+
+def _parse_nces_csv(file_path, encoding: str, columns: frozenset, dtypes: Dict,
+                    row_mask=None) -> pd.DataFrame:
+    """
+    Read the needed columns of an NCES CSV file.
+
+    Column names are matched case-insensitively and returned uppercase. When
+    pyarrow is installed the file is parsed by its multithreaded CSV reader;
+    otherwise it is read in chunks and each chunk is filtered with row_mask as
+    soon as it is parsed, so rows that are dropped anyway are never held in
+    memory all at once.
+    """
+    header = pd.read_csv(file_path, encoding=encoding, nrows=0).columns
+    usecols = [col for col in header if col.upper() in columns]
+    dtype = {col: dtypes[col.upper()] for col in usecols if col.upper() in dtypes}
+
+    if PYARROW_AVAILABLE and usecols:
+        parts = [_parse_csv_arrow(file_path, encoding, usecols, dtype)]
+    else:
+        parts = pd.read_csv(file_path, encoding=encoding, usecols=usecols, dtype=dtype,
+                            chunksize=_CSV_CHUNK_SIZE, low_memory=False)
+
+    kept = []
+    for part in parts:
+        part.columns = part.columns.str.upper()
+        if row_mask is not None:
+            part = part[row_mask(part).to_numpy(dtype=bool, na_value=False)]
+        kept.append(part)
+    df = pd.concat(kept)
+
+    # Chunks with different category sets concatenate to object
+    categories = [col for col, kind in dtypes.items() if kind == 'category' and col in df.columns]
+    df[categories] = df[categories].astype('category')
+    return df
+
+
+def _parse_csv_arrow(file_path, encoding: str, usecols: List[str], dtype: Dict) -> pd.DataFrame:
+    """
+    Parse the given CSV columns with pyarrow, treating empty strings as missing like pandas.
+
+    The columns stay Arrow-backed (pd.ArrowDtype), so the text is not copied
+    into Python string objects.
+    """
+    try:
+        table = pa_csv.read_csv(
+            file_path,
+            read_options=pa_csv.ReadOptions(encoding=encoding),
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=usecols,
+                # Parse ID columns as text so their leading zeros are kept
+                column_types={col: pa.string() for col, kind in dtype.items() if kind is str},
+                strings_can_be_null=True,
+            ),
+        )
+    except pa.ArrowInvalid as e:
+        # Text columns given a type raise on bytes that are not valid in the
+        # encoding; latin1 decodes any byte, so there the error is genuine
+        if encoding == 'latin1':
+            raise
+        raise UnicodeDecodeError(encoding, b'', 0, 0, str(e)) from e
+
+    for i, column in enumerate(table.schema):
+        # Arrow keeps text it cannot decode as raw bytes in untyped columns
+        if pa.types.is_binary(column.type):
+            raise UnicodeDecodeError(encoding, b'', 0, 0, f"undecodable text in column {column.name}")
+        # An all-empty column has no type; treat it as text so fillna('') works
+        if pa.types.is_null(column.type):
+            table = table.set_column(i, column.name, table.column(i).cast(pa.string()))
+
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
 def load_ccd_data(file_path: Optional[str] = None,
                   data_dir: Optional[str] = None,
                   high_schools_only: bool = True) -> pd.DataFrame:
     """
     Load NCES Common Core of Data (public schools).
 
+    Only the key fields listed in download_instructions_ccd() are loaded.
+
     Args:
         file_path: Path to specific CCD CSV file (if None, finds latest)
         data_dir: Directory containing NCES data files
@@ -214,31 +404,12 @@ def load_ccd_data(file_path: Optional[str] = None,
                 "Use print_download_instructions('ccd') for details."
             )
 
-    # Load the CSV file
-    # Note: NCES files often have encoding issues, try UTF-8 first, then latin1
-    try:
-        df = pd.read_csv(file_path, encoding='utf-8', low_memory=False)
-    except UnicodeDecodeError:
-        df = pd.read_csv(file_path, encoding='latin1', low_memory=False)
+    # Filter to high schools while reading if requested
+    row_mask = _ccd_high_school_mask if high_schools_only else None
 
-    # Standardize column names to uppercase for consistency
-    df.columns = df.columns.str.upper()
-
-    # Filter to high schools if requested
-    if high_schools_only:
-        # LEVEL column: 1=Primary, 2=Middle, 3=High, 4=Other/Alternative
-        # Some files may have different column names for level
-        level_col = None
-        for col in ['LEVEL', 'SCH_LEVEL', 'SCHOOL_LEVEL']:
-            if col in df.columns:
-                level_col = col
-                break
-
-        if level_col:
-            # Keep high schools (level 3) and schools with multiple levels including high
-            df = df[df[level_col].astype(str).str.contains('3', na=False)]
-
-    return df
+    # Load the CSV file
+    # Note: NCES files often have encoding issues, so the encoding is detected first
+    return _read_nces_csv(file_path, _CCD_COLUMNS, _CCD_DTYPES, row_mask)
 
 
 def load_pss_data(file_path: Optional[str] = None,
@@ -247,6 +418,8 @@ def load_pss_data(file_path: Optional[str] = None,
     """
     Load NCES Private School Survey data.
 
+    Only the key fields listed in download_instructions_pss() are loaded.
+
     Args:
         file_path: Path to specific PSS CSV file (if None, finds latest)
         data_dir: Directory containing NCES data files
@@ -266,44 +439,28 @@ def load_pss_data(file_path: Optional[str] = None,
                 "Use print_download_instructions('pss') for details."
             )
 
-    # Load the CSV file
-    try:
-        df = pd.read_csv(file_path, encoding='utf-8', low_memory=False)
-    except UnicodeDecodeError:
-        df = pd.read_csv(file_path, encoding='latin1', low_memory=False)
-
-    # Standardize column names to uppercase
-    df.columns = df.columns.str.upper()
+    # Filter to high schools while reading if requested
+    row_mask = _pss_high_school_mask if high_schools_only else None
 
-    # Filter to high schools if requested
-    if high_schools_only:
-        # PSS LEVEL encoding may vary by year, but typically includes high school codes
-        level_col = None
-        for col in ['LEVEL', 'LEVEL12', 'LEVEL_CODE']:
-            if col in df.columns:
-                level_col = col
-                break
-
-        if level_col:
-            # Keep schools that serve high school grades
-            # This typically means having grades 9-12
-            df = df[df[level_col].astype(str).str.contains('3|4|HS|HIGH', case=False, na=False)]
-
-    return df
+    # Load the CSV file
+    return _read_nces_csv(file_path, _PSS_COLUMNS, _PSS_DTYPES, row_mask)
 
 
-def prepare_nces_for_matching(df: pd.DataFrame, source: str = 'ccd') -> pd.DataFrame:
+def prepare_nces_for_matching(df: pd.DataFrame, source: str = 'ccd',
+                              inplace: bool = False) -> pd.DataFrame:
     """
     Prepare NCES data for matching by standardizing columns and adding normalized names.
 
     Args:
         df: Raw NCES DataFrame (CCD or PSS)
         source: 'ccd' or 'pss' to indicate data source
+        inplace: If True, add the columns to df itself instead of to a copy,
+                 saving a full copy of the NCES data when df is not needed afterwards
 
     Returns:
         DataFrame with standardized columns and normalized names
     """
-    result = df.copy()
+    result = df if inplace else df.copy()
 
     # Identify key columns based on source
     if source == 'ccd':
@@ -324,7 +481,7 @@ def prepare_nces_for_matching(df: pd.DataFrame, source: str = 'ccd') -> pd.DataF
     # Create standardized columns
     result['nces_id'] = result[id_col] if id_col in result.columns else ''
     result['school_name_original'] = result[name_col] if name_col in result.columns else ''
-    result['school_name_normalized'] = result['school_name_original'].apply(normalize_hs_name)
+    result['school_name_normalized'] = normalize_hs_name_series(result['school_name_original'])
 
     # Combine street address fields
     street_parts = []
@@ -332,10 +489,10 @@ def prepare_nces_for_matching(df: pd.DataFrame, source: str = 'ccd') -> pd.DataF
         if col in result.columns:
             street_parts.append(result[col].fillna(''))
     if street_parts:
-        result['street'] = street_parts[0]
-        for part in street_parts[1:]:
-            result['street'] = result['street'] + ' ' + part
-        result['street'] = result['street'].str.strip()
+        street = street_parts[0]
+        if len(street_parts) > 1:
+            street = street.str.cat(street_parts[1:], sep=' ')
+        result['street'] = street.str.strip()
     else:
         result['street'] = ''
 
@@ -344,17 +501,97 @@ def prepare_nces_for_matching(df: pd.DataFrame, source: str = 'ccd') -> pd.DataF
     result['zip'] = result[zip_col] if zip_col in result.columns else ''
     result['source'] = source
 
+    result[_CATEGORY_COLUMNS] = result[_CATEGORY_COLUMNS].astype('category')
+
     return result
 
 
+def _prepared_cache_prefix(file_path: Path, high_schools_only: bool) -> str:
+    """
+    File name prefix shared by every cached version of an NCES file's prepared data.
+    """
+    scope = 'hs' if high_schools_only else 'all'
+    return f"{file_path.stem}_{scope}_"
+
+
+def _prepared_cache_path(file_path: Path, high_schools_only: bool) -> Path:
+    """
+    Path of the cached prepared data for an NCES file.
+
+    The name is keyed by the file's modification time and by the package,
+    prepared data layout and pandas versions, so a cache is never read back
+    by code that would have prepared the data differently.
+    """
+    mtime = file_path.stat().st_mtime_ns
+    versions = f"{__version__}/{_PREPARED_CACHE_VERSION}/{pd.__version__}"
+    tag = hashlib.sha1(versions.encode()).hexdigest()[:8]
+    suffix = '.parquet' if PYARROW_AVAILABLE else '.pkl'
+    name = f"{_prepared_cache_prefix(file_path, high_schools_only)}{mtime}_{tag}{suffix}"
+    return file_path.parent / '.cache' / name
+
+
+def _load_prepared_nces(source: str,
+                        data_dir: Optional[str] = None,
+                        high_schools_only: bool = True,
+                        use_cache: bool = False) -> pd.DataFrame:
+    """
+    Load and prepare the latest CCD or PSS file, reusing a cached copy when it is current.
+
+    The cache lives in a .cache folder next to the CSV file and is rebuilt
+    whenever the CSV file or the preparing code changes.
+
+    Raises:
+        FileNotFoundError: If no data file is found for the source
+    """
+    if source == 'ccd':
+        file_path, load = find_latest_ccd_file(data_dir), load_ccd_data
+    else:
+        file_path, load = find_latest_pss_file(data_dir), load_pss_data
+
+    # Without a file, the loader raises FileNotFoundError with download hints
+    if file_path is None or not use_cache:
+        df = load(file_path=file_path, data_dir=data_dir, high_schools_only=high_schools_only)
+        return prepare_nces_for_matching(df, source=source, inplace=True)
+
+    cache_path = _prepared_cache_path(file_path, high_schools_only)
+    if cache_path.exists():
+        if cache_path.suffix == '.parquet':
+            return pd.read_parquet(cache_path)
+        return pd.read_pickle(cache_path)
+
+    df = load(file_path=file_path, high_schools_only=high_schools_only)
+    prepared = prepare_nces_for_matching(df, source=source, inplace=True)
+
+    # Caching is best effort, e.g. the data directory may be read-only
+    try:
+        cache_path.parent.mkdir(exist_ok=True)
+        # Drop caches of earlier versions of the same file or of this package
+        for stale in cache_path.parent.glob(_prepared_cache_prefix(file_path, high_schools_only) + '*'):
+            stale.unlink()
+        if cache_path.suffix == '.parquet':
+            prepared.to_parquet(cache_path, compression='zstd')
+        else:
+            prepared.to_pickle(cache_path, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+
+    return prepared
+
+
 def load_and_prepare_all_nces(data_dir: Optional[str] = None,
-                               high_schools_only: bool = True) -> pd.DataFrame:
+                               high_schools_only: bool = True,
+                               use_cache: bool = False) -> pd.DataFrame:
     """
     Load and combine both CCD (public) and PSS (private) school data.
 
     Args:
         data_dir: Directory containing NCES data files
         high_schools_only: If True, filter to only high schools
+        use_cache: If True, save the prepared data in a .cache folder next to
+                   the CSV files and reuse it on later calls until the files or
+                   this package change. The cache is Parquet when pyarrow is
+                   installed and pickle otherwise; only enable it for data
+                   directories you trust, since loading a pickle can run code.
 
     Returns:
         Combined DataFrame with all NCES schools
@@ -363,8 +600,7 @@ def load_and_prepare_all_nces(data_dir: Optional[str] = None,
 
     # Try to load CCD data
     try:
-        ccd = load_ccd_data(data_dir=data_dir, high_schools_only=high_schools_only)
-        ccd_prepared = prepare_nces_for_matching(ccd, source='ccd')
+        ccd_prepared = _load_prepared_nces('ccd', data_dir, high_schools_only, use_cache)
         dfs.append(ccd_prepared)
         print(f"Loaded {len(ccd_prepared):,} public schools (CCD)")
     except FileNotFoundError as e:
@@ -372,8 +608,7 @@ def load_and_prepare_all_nces(data_dir: Optional[str] = None,
 
     # Try to load PSS data
     try:
-        pss = load_pss_data(data_dir=data_dir, high_schools_only=high_schools_only)
-        pss_prepared = prepare_nces_for_matching(pss, source='pss')
+        pss_prepared = _load_prepared_nces('pss', data_dir, high_schools_only, use_cache)
         dfs.append(pss_prepared)
         print(f"Loaded {len(pss_prepared):,} private schools (PSS)")
     except FileNotFoundError as e:
@@ -387,12 +622,96 @@ def load_and_prepare_all_nces(data_dir: Optional[str] = None,
 
     # Combine all data
     combined = pd.concat(dfs, ignore_index=True)
+
+    # Concatenating categoricals with different categories falls back to object
+    combined[_CATEGORY_COLUMNS] = combined[_CATEGORY_COLUMNS].astype('category')
     print(f"Total NCES schools loaded: {len(combined):,}")
 
     return combined
 
 
-def create_nces_lookup(nces_df: pd.DataFrame) -> Dict[str, List[Dict]]:
+class NCESRecord(NamedTuple):
+    """
+    One NCES school in a lookup built by create_nces_lookup().
+
+    state_u and city_u are the uppercase state and city ('' when missing),
+    used for disambiguation in match_to_nces(). The other fields can also be
+    read by name, as in the school dictionaries of earlier versions:
+    record['state'] is record.state, 'state' in record is True and
+    dict(record) or record.to_dict() gives the school dictionary. Iterating
+    and json.dumps() still see a tuple of every field.
+    """
+    nces_id: str
+    name: str
+    street: str
+    city: str
+    state: str
+    zip: str
+    source: str
+    state_u: str
+    city_u: str
+
+    # Keys of the school dictionaries of earlier versions
+    _school_keys = ('nces_id', 'name', 'street', 'city', 'state', 'zip', 'source')
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key not in self._school_keys:
+                raise KeyError(key)
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+    def __contains__(self, key) -> bool:
+        return key in self._school_keys
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self._school_keys else default
+
+    def keys(self) -> Tuple[str, ...]:
+        return self._school_keys
+
+    def to_dict(self) -> Dict[str, str]:
+        """
+        Return the school dictionary of earlier versions, without state_u/city_u.
+        """
+        return {key: getattr(self, key) for key in self._school_keys}
+
+    @classmethod
+    def from_dict(cls, school: Dict) -> 'NCESRecord':
+        """
+        Build a record from a school dictionary of an earlier create_nces_lookup().
+        """
+        def match_key(value):
+            return value.upper() if isinstance(value, str) else ''
+
+        return cls(school['nces_id'], school['name'], school['street'], school['city'],
+                   school['state'], school['zip'], school['source'],
+                   match_key(school['state']), match_key(school['city']))
+
+
+@dataclass
+class NCESLookup(Mapping):
+    """
+    NCES school records indexed for matching, as built by create_nces_lookup().
+
+    Reads like a dictionary mapping normalized names to lists of NCESRecord
+    (by_name). by_name_state indexes the same records by (normalized name,
+    uppercase state) so state disambiguation is a single lookup.
+    """
+    by_name: Dict[str, List[NCESRecord]] = dc_field(default_factory=dict)
+    by_name_state: Dict[Tuple[str, str], List[NCESRecord]] = dc_field(default_factory=dict)
+
+    def __getitem__(self, normalized: str) -> List[NCESRecord]:
+        return self.by_name[normalized]
+
+    def __iter__(self):
+        return iter(self.by_name)
+
+    def __len__(self) -> int:
+        return len(self.by_name)
+
+
+def create_nces_lookup(nces_df: pd.DataFrame) -> NCESLookup:
     """
     Create a lookup dictionary for fast NCES matching.
 
@@ -400,24 +719,22 @@ def create_nces_lookup(nces_df: pd.DataFrame) -> Dict[str, List[Dict]]:
         nces_df: Prepared NCES DataFrame with normalized names
 
     Returns:
-        Dictionary mapping normalized names to list of school records
-    """
-    lookup = {}
-
-    for _, row in nces_df.iterrows():
-        normalized = row['school_name_normalized']
-        if pd.notna(normalized) and normalized != '':
-            if normalized not in lookup:
-                lookup[normalized] = []
-            lookup[normalized].append({
-                'nces_id': row['nces_id'],
-                'name': row['school_name_original'],
-                'street': row['street'],
-                'city': row['city'],
-                'state': row['state'],
-                'zip': row['zip'],
-                'source': row['source']
-            })
+        NCESLookup mapping normalized names to lists of NCESRecord
+    """
+    names = nces_df['school_name_normalized']
+    schools = nces_df[names.notna() & (names != '')]
+
+    # Build every record in one pass, then group them by normalized name.
+    # state_u/city_u are uppercased once here for disambiguation in match_to_nces().
+    cols = ['nces_id', 'school_name_original', 'street', 'city', 'state', 'zip', 'source']
+    columns = [schools[col].tolist() for col in cols]
+    columns += [_match_key(schools, col).fillna('').tolist() for col in ('state', 'city')]
+    records = map(NCESRecord._make, zip(*columns))
+
+    lookup = NCESLookup()
+    for normalized, record in zip(schools['school_name_normalized'].tolist(), records):
+        lookup.by_name.setdefault(normalized, []).append(record)
+        lookup.by_name_state.setdefault((normalized, record.state_u), []).append(record)
 
     return lookup
 
@@ -425,8 +742,9 @@ def create_nces_lookup(nces_df: pd.DataFrame) -> Dict[str, List[Dict]]:
 def match_to_nces(school_name: str,
                   state: Optional[str] = None,
                   city: Optional[str] = None,
-                  nces_lookup: Optional[Dict] = None,
-                  nces_df: Optional[pd.DataFrame] = None) -> Optional[Dict]:
+                  nces_lookup: Optional[Mapping] = None,
+                  nces_df: Optional[pd.DataFrame] = None,
+                  pre_normalized: Optional[str] = None) -> Optional[Dict]:
     """
     Match a school name to NCES database.
 
@@ -434,8 +752,11 @@ def match_to_nces(school_name: str,
         school_name: High school name to match
         state: State code (e.g., 'CA', 'NY') for disambiguation
         city: City name for disambiguation
-        nces_lookup: Pre-built NCES lookup dictionary (preferred for batch matching)
+        nces_lookup: Pre-built NCES lookup dictionary (preferred for batch matching).
+                     A plain dictionary of school dictionaries, as returned by
+                     earlier versions of create_nces_lookup(), also works.
         nces_df: NCES DataFrame (will build lookup if nces_lookup not provided)
+        pre_normalized: normalize_hs_name(school_name), if already computed
 
     Returns:
         Dictionary with match information, or None if no match found
@@ -456,51 +777,79 @@ def match_to_nces(school_name: str,
         nces_lookup = create_nces_lookup(nces_df)
 
     # Normalize the input name
-    normalized = normalize_hs_name(school_name)
+    if pre_normalized is None:
+        normalized = normalize_hs_name(school_name)
+    else:
+        normalized = pre_normalized
 
     if not normalized or normalized not in nces_lookup:
         return None
 
     candidates = nces_lookup[normalized]
+    if candidates and not isinstance(candidates[0], NCESRecord):
+        # A lookup of school dictionaries, as built by earlier versions
+        candidates = [NCESRecord.from_dict(c) for c in candidates]
 
     # If only one match, return it
     if len(candidates) == 1:
-        result = candidates[0].copy()
-        result['matched_name'] = result.pop('name')
-        result['confidence'] = 'exact'
-        return result
+        return _match_result(candidates[0], 'exact')
 
     # Multiple matches - try to disambiguate by state
     if state:
-        state_matches = [c for c in candidates if c['state'].upper() == state.upper()]
+        state_u = state.upper()
+        by_name_state = getattr(nces_lookup, 'by_name_state', None)
+        if by_name_state is not None:
+            state_matches = by_name_state.get((normalized, state_u), [])
+        else:
+            # A plain {normalized name: records} dictionary
+            state_matches = [c for c in candidates if c.state_u == state_u]
         if len(state_matches) == 1:
-            result = state_matches[0].copy()
-            result['matched_name'] = result.pop('name')
-            result['confidence'] = 'exact'
-            return result
+            return _match_result(state_matches[0], 'exact')
         elif len(state_matches) > 1:
             candidates = state_matches
 
     # Try to disambiguate by city if we still have multiple matches
     if city and len(candidates) > 1:
-        city_matches = [c for c in candidates
-                       if c['city'].upper() == city.upper()]
+        city_u = city.upper()
+        city_matches = [c for c in candidates if c.city_u == city_u]
         if len(city_matches) == 1:
-            result = city_matches[0].copy()
-            result['matched_name'] = result.pop('name')
-            result['confidence'] = 'exact'
-            return result
+            return _match_result(city_matches[0], 'exact')
         elif len(city_matches) > 1:
             candidates = city_matches
 
     # Still ambiguous - return first match but mark as ambiguous
-    result = candidates[0].copy()
-    result['matched_name'] = result.pop('name')
-    result['confidence'] = 'ambiguous'
+    result = _match_result(candidates[0], 'ambiguous')
     result['num_candidates'] = len(candidates)
     return result
 
 
+def _match_result(record: NCESRecord, confidence: str) -> Dict:
+    """
+    Turn a lookup record into a match_to_nces() result.
+    """
+    return {
+        'nces_id': record.nces_id,
+        'street': record.street,
+        'city': record.city,
+        'state': record.state,
+        'zip': record.zip,
+        'source': record.source,
+        'matched_name': record.name,
+        'confidence': confidence,
+    }
+
+
+def _match_key(df: pd.DataFrame, col: Optional[str]) -> pd.Series:
+    """
+    Uppercase a state or city column for matching, with missing or empty values as NaN.
+    """
+    if not col or col not in df.columns:
+        return pd.Series(np.nan, index=df.index, dtype=object)
+
+    keys = df[col].astype(object).str.upper()
+    return keys.where(keys != '')
+
+
 def batch_match_to_nces(schools_df: pd.DataFrame,
                         name_col: str = 'high_school',
                         state_col: Optional[str] = 'state',
@@ -525,42 +874,79 @@ def batch_match_to_nces(schools_df: pd.DataFrame,
     if nces_df is None:
         nces_df = load_and_prepare_all_nces(data_dir=data_dir)
 
-    # Create lookup for efficient matching
-    nces_lookup = create_nces_lookup(nces_df)
-
     # Prepare result DataFrame
     result = schools_df.copy()
 
-    # Initialize new columns
-    result['nces_id'] = None
-    result['nces_matched_name'] = None
-    result['nces_street'] = None
-    result['nces_city'] = None
-    result['nces_state'] = None
-    result['nces_zip'] = None
-    result['nces_source'] = None
-    result['nces_confidence'] = None
-
-    # Match each school
-    matched_count = 0
-    for idx, row in result.iterrows():
-        school_name = row[name_col]
-        state = row[state_col] if state_col and state_col in result.columns else None
-        city = row[city_col] if city_col and city_col in result.columns else None
-
-        match = match_to_nces(school_name, state, city, nces_lookup=nces_lookup)
-
-        if match:
-            result.at[idx, 'nces_id'] = match['nces_id']
-            result.at[idx, 'nces_matched_name'] = match['matched_name']
-            result.at[idx, 'nces_street'] = match['street']
-            result.at[idx, 'nces_city'] = match['city']
-            result.at[idx, 'nces_state'] = match['state']
-            result.at[idx, 'nces_zip'] = match['zip']
-            result.at[idx, 'nces_source'] = match['source']
-            result.at[idx, 'nces_confidence'] = match['confidence']
-            matched_count += 1
-
+    # Normalize the names and disambiguation keys of every school at once.
+    # Rosters repeat school names, so each distinct name is normalized once;
+    # the trailing '' is picked for missing names (code -1).
+    codes, names = pd.factorize(result[name_col])
+    normalized = normalize_hs_name_series(pd.Series(names, dtype=object)).to_numpy(dtype=object)
+    normalized = np.append(normalized, '')
+
+    keys = ['name', 'state', 'city']
+    queries = pd.DataFrame({
+        'name': normalized[codes],
+        'state': _match_key(result, state_col).to_numpy(),
+        'city': _match_key(result, city_col).to_numpy(),
+    })
+    unique = queries.drop_duplicates(keys).reset_index(drop=True)
+
+    # NCES rows by position, with the same keys as the lookup dictionary
+    nces_keys = pd.DataFrame({
+        'name': nces_df['school_name_normalized'].to_numpy(),
+        'state': _match_key(nces_df, 'state').to_numpy(),
+        'city': _match_key(nces_df, 'city').to_numpy(),
+        'row': np.arange(len(nces_df)),
+    })
+    nces_keys = nces_keys[nces_keys['name'].notna() & (nces_keys['name'] != '')]
+
+    def candidates(by):
+        # First NCES row and candidate count for each unique school
+        stats = nces_keys.groupby(by)['row'].agg(['first', 'size'])
+        found = unique.merge(stats, how='left', left_on=by, right_index=True)
+        return found['first'].to_numpy(), found['size'].fillna(0).to_numpy()
+
+    # Same disambiguation as match_to_nces(): by name, then state, then city
+    first, size = candidates(['name'])
+    state_first, state_size = candidates(['name', 'state'])
+    by_state = unique['state'].notna().to_numpy() & (size > 1) & (state_size > 0)
+    first = np.where(by_state, state_first, first)
+    size = np.where(by_state, state_size, size)
+
+    city_first, city_size = candidates(['name', 'city'])
+    state_city_first, state_city_size = candidates(keys)
+    city_first = np.where(by_state, state_city_first, city_first)
+    city_size = np.where(by_state, state_city_size, city_size)
+    by_city = unique['city'].notna().to_numpy() & (size > 1) & (city_size > 0)
+    first = np.where(by_city, city_first, first)
+    size = np.where(by_city, city_size, size)
+
+    unique['row'] = first
+    unique['confidence'] = np.where(size == 1, 'exact', 'ambiguous')
+    matches = queries.merge(unique, how='left', on=keys)
+    matched = matches['row'].notna().to_numpy()
+    rows = matches['row'].to_numpy()[matched].astype(np.intp)
+
+    # Add the match columns, leaving None for unmatched schools
+    match_cols = {
+        'nces_id': 'nces_id',
+        'nces_matched_name': 'school_name_original',
+        'nces_street': 'street',
+        'nces_city': 'city',
+        'nces_state': 'state',
+        'nces_zip': 'zip',
+        'nces_source': 'source',
+    }
+    for col, nces_col in match_cols.items():
+        values = np.full(len(result), None, dtype=object)
+        values[matched] = nces_df[nces_col].to_numpy(dtype=object)[rows]
+        result[col] = values
+    confidence = np.full(len(result), None, dtype=object)
+    confidence[matched] = matches['confidence'].to_numpy(dtype=object)[matched]
+    result['nces_confidence'] = confidence
+
+    matched_count = int(matched.sum())
     print(f"Matched {matched_count:,} of {len(result):,} schools "
           f"({matched_count/len(result)*100:.1f}%)")
 
@@ -570,7 +956,7 @@ def batch_match_to_nces(schools_df: pd.DataFrame,
 def get_nces_standardized_name(school_name: str,
                                state: Optional[str] = None,
                                city: Optional[str] = None,
-                               nces_lookup: Optional[Dict] = None,
+                               nces_lookup: Optional[Mapping] = None,
                                nces_df: Optional[pd.DataFrame] = None,
                                add_hs_suffix: bool = True) -> str:
     """
@@ -587,19 +973,20 @@ def get_nces_standardized_name(school_name: str,
     Returns:
         Standardized school name, or original name if no match found
     """
-    match = match_to_nces(school_name, state, city, nces_lookup, nces_df)
+    normalized = normalize_hs_name(school_name)
+    match = match_to_nces(school_name, state, city, nces_lookup, nces_df,
+                          pre_normalized=normalized)
 
     if match:
         name = match['matched_name']
         if add_hs_suffix and 'H.S.' not in name and 'High School' not in name:
-            # Add H.S. suffix if not already present
-            from .normalize import standardize_suffix
-            name = standardize_suffix(name)
+            # Add H.S. suffix if not already present. The matched name was
+            # looked up by its normalized form, so that is its base.
+            name = standardize_suffix_from_base(name, normalized)
         return name
 
     # No match - return original name
     if add_hs_suffix:
-        from .normalize import standardize_suffix
-        return standardize_suffix(school_name)
+        return standardize_suffix_from_base(school_name, normalized)
 
     return school_name
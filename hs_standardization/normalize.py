@@ -8,9 +8,71 @@ Extracted from the womens-college-basketball project.
 """
 
 import re
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
 
 
+# Common high school suffixes (High School, H.S., HS, H.S). Removing them one
+# after another strips a trailing run of them in this order, which the chain
+# below matches in a single pass.
+_SUFFIX_CHAIN = r'(?i:(?:\s+H\.S)?(?:\s+HS)?(?:\s+H\.S\.)?(?:\s+HIGH\s+SCHOOL)?)$'
+
+# St./Saint is only expanded when it is not followed by the suffixes alone,
+# since the suffixes are removed first and take the space after "ST" with them
+_SUFFIX_OR_SAINT_RE = re.compile(
+    r'(?P<saint>\bST\.?(?!' + _SUFFIX_CHAIN + r')\s+)|(?=\s)' + _SUFFIX_CHAIN
+)
+_PUNCT_TABLE = str.maketrans('', '', ".,'")
+_PAREN_RE = re.compile(r'\s*\([^)]+\)$')
+_WS_RE = re.compile(r'\s+')
+
+
+# Name keywords for each school type, checked in this order (first match wins)
+_SCHOOL_TYPE_KEYWORDS = [
+    # Prep schools and academies
+    ('prep', ['ACADEMY', 'PREP', 'PREPARATORY']),
+    # Private school indicators
+    ('private', [
+        'SAINT ', 'ST. ', 'BISHOP ', 'CATHOLIC', 'CHRISTIAN',
+        'LUTHERAN', 'METHODIST', 'BAPTIST', 'EPISCOPAL'
+    ]),
+    # International patterns
+    ('international', [
+        'IES ', 'INSTITUT', 'LYCEE', 'GYMNASIUM', 'SECONDARY SCHOOL',
+        'COLLEGE '  # In international context, college often means high school
+    ]),
+    # Common public school patterns
+    ('public', [
+        ' HS', 'HIGH SCHOOL', 'H.S.', 'CENTRAL', 'EAST ', 'WEST ',
+        'NORTH ', 'SOUTH '
+    ]),
+]
+
+# One substring alternation per school type
+_SCHOOL_TYPE_RES = [
+    (school_type, re.compile('|'.join(map(re.escape, keywords))))
+    for school_type, keywords in _SCHOOL_TYPE_KEYWORDS
+]
+
+
+# Normalized names shared by many schools across states and cities
+_COMMON_NAMES = frozenset({
+    'CENTRAL', 'LIBERTY', 'LINCOLN', 'WASHINGTON', 'JEFFERSON',
+    'ROOSEVELT', 'FRANKLIN', 'MADISON', 'KENNEDY', 'WILSON',
+    'EAST', 'WEST', 'NORTH', 'SOUTH', 'NORTHEAST', 'NORTHWEST',
+    'SOUTHEAST', 'SOUTHWEST', 'CENTENNIAL', 'HIGHLAND', 'RIVERSIDE'
+})
+
+# Substrings that mark a name as already having a high school suffix
+_SUFFIX_MARKERS = ('HIGH SCHOOL', 'HS', 'H.S.')
+
+
+def _replace_suffix_or_saint(match):
+    return 'SAINT ' if match.group('saint') else ''
+
+
 def normalize_hs_name(name):
     """
     Create a normalized version of a high school name for matching.
@@ -41,35 +103,67 @@ def normalize_hs_name(name):
     if pd.isna(name) or name == '':
         return ''
 
-    # Convert to string and uppercase
-    normalized = str(name).upper().strip()
+    return _normalize_hs_name(str(name))
 
-    # Remove common high school suffixes
-    # Order matters - remove longer patterns first
-    suffixes = [
-        r'\s+HIGH\s+SCHOOL$',
-        r'\s+H\.S\.$',
-        r'\s+HS$',
-        r'\s+H\.S$'
-    ]
 
-    for suffix in suffixes:
-        normalized = re.sub(suffix, '', normalized, flags=re.IGNORECASE)
+@lru_cache(maxsize=200_000)
+def _normalize_hs_name(name):
+    """
+    Normalize a non-empty name string for normalize_hs_name().
+
+    Rosters list the same high school for many players, so results are cached.
+    """
+    # Convert to uppercase
+    normalized = name.upper().strip()
 
-    # Standardize St./Saint
-    normalized = re.sub(r'\bST\.?\s+', 'SAINT ', normalized)
+    # Remove common high school suffixes and standardize St./Saint
+    normalized = _SUFFIX_OR_SAINT_RE.sub(_replace_suffix_or_saint, normalized)
 
     # Remove periods, commas, apostrophes
-    normalized = re.sub(r'[.,\']', '', normalized)
+    normalized = normalized.translate(_PUNCT_TABLE)
 
     # Remove parenthetical notes (but save them separately for context)
     # Examples: "Tappan Zee (Saint Rose)" -> "Tappan Zee"
-    normalized = re.sub(r'\s*\([^)]+\)$', '', normalized)
+    if '(' in normalized:
+        normalized = _PAREN_RE.sub('', normalized)
 
     # Collapse multiple spaces
-    normalized = re.sub(r'\s+', ' ', normalized).strip()
+    return ' '.join(normalized.split())
+
+
+def normalize_hs_name_series(names):
+    """
+    Normalize a Series of high school names for matching.
+
+    This is the column-level counterpart of normalize_hs_name() and produces
+    the same values, but runs each step once over the whole Series with the
+    pandas string methods. Prefer it over names.apply(normalize_hs_name) for
+    large DataFrames such as the NCES directories.
+
+    Args:
+        names (pd.Series): Original high school names
+
+    Returns:
+        pd.Series: Normalized names with the same index; missing values become ''
+
+    Examples:
+        >>> normalize_hs_name_series(pd.Series(["Central High School", None])).tolist()
+        ['CENTRAL', '']
+    """
+    names = pd.Series(names)
+
+    normalized = (
+        names.astype(str)
+        .str.upper()
+        .str.strip()
+        .str.replace(_SUFFIX_OR_SAINT_RE, _replace_suffix_or_saint, regex=True)
+        .str.translate(_PUNCT_TABLE)
+        .str.replace(_PAREN_RE, '', regex=True)
+        .str.replace(_WS_RE, ' ', regex=True)
+        .str.strip()
+    )
 
-    return normalized
+    return normalized.where(names.notna(), '')
 
 
 def extract_disambiguator(name):
@@ -128,32 +222,43 @@ def categorize_school_type(name):
 
     name_upper = str(name).upper()
 
-    # Prep schools and academies
-    if any(pattern in name_upper for pattern in ['ACADEMY', 'PREP', 'PREPARATORY']):
-        return 'prep'
+    for school_type, pattern in _SCHOOL_TYPE_RES:
+        if pattern.search(name_upper):
+            return school_type
 
-    # Private school indicators
-    if any(pattern in name_upper for pattern in [
-        'SAINT ', 'ST. ', 'BISHOP ', 'CATHOLIC', 'CHRISTIAN',
-        'LUTHERAN', 'METHODIST', 'BAPTIST', 'EPISCOPAL'
-    ]):
-        return 'private'
+    return 'unknown'
 
-    # International patterns
-    if any(pattern in name_upper for pattern in [
-        'IES ', 'INSTITUT', 'LYCEE', 'GYMNASIUM', 'SECONDARY SCHOOL',
-        'COLLEGE '  # In international context, college often means high school
-    ]):
-        return 'international'
 
-    # Common public school patterns
-    if any(pattern in name_upper for pattern in [
-        ' HS', 'HIGH SCHOOL', 'H.S.', 'CENTRAL', 'EAST ', 'WEST ',
-        'NORTH ', 'SOUTH '
-    ]):
-        return 'public'
+def categorize_school_type_series(names):
+    """
+    Categorize the school type of every name in a Series.
 
-    return 'unknown'
+    This is the column-level counterpart of categorize_school_type() and
+    returns the same categories, testing each keyword pattern once over the
+    whole Series.
+
+    Args:
+        names (pd.Series): High school names
+
+    Returns:
+        pd.Series: 'public', 'private', 'prep', 'international', or 'unknown'
+        for each name, with the same index
+
+    Examples:
+        >>> categorize_school_type_series(pd.Series(["IMG Academy", "Central High School"])).tolist()
+        ['prep', 'public']
+    """
+    names = pd.Series(names)
+    names_upper = names.astype(str).str.upper()
+
+    conditions = [names.isna().to_numpy()]
+    conditions += [
+        names_upper.str.contains(pattern, na=False).to_numpy(dtype=bool)
+        for _, pattern in _SCHOOL_TYPE_RES
+    ]
+    choices = ['unknown'] + [school_type for school_type, _ in _SCHOOL_TYPE_RES]
+
+    return pd.Series(np.select(conditions, choices, default='unknown'), index=names.index)
 
 
 def is_likely_common_name(normalized_name):
@@ -175,14 +280,7 @@ def is_likely_common_name(normalized_name):
         >>> is_likely_common_name("IMG ACADEMY")
         False
     """
-    common_names = {
-        'CENTRAL', 'LIBERTY', 'LINCOLN', 'WASHINGTON', 'JEFFERSON',
-        'ROOSEVELT', 'FRANKLIN', 'MADISON', 'KENNEDY', 'WILSON',
-        'EAST', 'WEST', 'NORTH', 'SOUTH', 'NORTHEAST', 'NORTHWEST',
-        'SOUTHEAST', 'SOUTHWEST', 'CENTENNIAL', 'HIGHLAND', 'RIVERSIDE'
-    }
-
-    return normalized_name in common_names
+    return normalized_name in _COMMON_NAMES
 
 
 def is_international_school(name, country=None):
@@ -236,11 +334,31 @@ def standardize_suffix(name, preferred_suffix="H.S."):
         return name
 
     # Get the base name (normalized)
-    base = normalize_hs_name(name)
+    return standardize_suffix_from_base(name, normalize_hs_name(name), preferred_suffix)
 
+
+def standardize_suffix_from_base(name, base, preferred_suffix="H.S."):
+    """
+    Standardize the high school suffix of a name whose normalized form is known.
+
+    Same as standardize_suffix(), but takes the normalize_hs_name() result for
+    name instead of computing it again, e.g. the key a name was matched on.
+
+    Args:
+        name (str): Original high school name
+        base (str): normalize_hs_name(name)
+        preferred_suffix (str): Desired suffix (default: "H.S.")
+
+    Returns:
+        str: Name with standardized suffix
+
+    Examples:
+        >>> standardize_suffix_from_base("Central HS", "CENTRAL")
+        'Central H.S.'
+    """
     # Check if original had a suffix
     name_upper = str(name).upper()
-    had_suffix = any(suffix in name_upper for suffix in ['HIGH SCHOOL', 'HS', 'H.S.'])
+    had_suffix = any(suffix in name_upper for suffix in _SUFFIX_MARKERS)
 
     if had_suffix and base:
         # Title case the base name
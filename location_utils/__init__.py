@@ -5,6 +5,20 @@ This module provides functions for extracting and standardizing country names
 from location strings (e.g., "London, England" or "Stockholm, Sweden").
 """
 
-from .parser import parse_city_country, standardize_country_name
+from .parser import (
+    CountryInfo,
+    LocationResult,
+    parse_city_country,
+    parse_city_country_batch,
+    standardize_country_name,
+    to_json_bytes,
+)
 
-__all__ = ['parse_city_country', 'standardize_country_name']
+__all__ = [
+    'CountryInfo',
+    'LocationResult',
+    'parse_city_country',
+    'parse_city_country_batch',
+    'standardize_country_name',
+    'to_json_bytes',
+]
@@ -0,0 +1,258 @@
+"""
+ISO 3166-1 country data.
+
+Generated by scripts/gen_iso.py from pycountry 26.2.16; do not edit.
+"""
+
+# One row per country: alpha_2, alpha_3, numeric, name, common_name, official_name
+COUNTRIES = (
+    ('AW', 'ABW', '533', 'Aruba', None, None),
+    ('AF', 'AFG', '004', 'Afghanistan', None, 'Islamic Republic of Afghanistan'),
+    ('AO', 'AGO', '024', 'Angola', None, 'Republic of Angola'),
+    ('AI', 'AIA', '660', 'Anguilla', None, None),
+    ('AX', 'ALA', '248', 'Åland Islands', None, None),
+    ('AL', 'ALB', '008', 'Albania', None, 'Republic of Albania'),
+    ('AD', 'AND', '020', 'Andorra', None, 'Principality of Andorra'),
+    ('AE', 'ARE', '784', 'United Arab Emirates', None, None),
+    ('AR', 'ARG', '032', 'Argentina', None, 'Argentine Republic'),
+    ('AM', 'ARM', '051', 'Armenia', None, 'Republic of Armenia'),
+    ('AS', 'ASM', '016', 'American Samoa', None, None),
+    ('AQ', 'ATA', '010', 'Antarctica', None, None),
+    ('TF', 'ATF', '260', 'French Southern Territories', None, None),
+    ('AG', 'ATG', '028', 'Antigua and Barbuda', None, None),
+    ('AU', 'AUS', '036', 'Australia', None, None),
+    ('AT', 'AUT', '040', 'Austria', None, 'Republic of Austria'),
+    ('AZ', 'AZE', '031', 'Azerbaijan', None, 'Republic of Azerbaijan'),
+    ('BI', 'BDI', '108', 'Burundi', None, 'Republic of Burundi'),
+    ('BE', 'BEL', '056', 'Belgium', None, 'Kingdom of Belgium'),
+    ('BJ', 'BEN', '204', 'Benin', None, 'Republic of Benin'),
+    ('BQ', 'BES', '535', 'Bonaire, Sint Eustatius and Saba', None, 'Bonaire, Sint Eustatius and Saba'),
+    ('BF', 'BFA', '854', 'Burkina Faso', None, None),
+    ('BD', 'BGD', '050', 'Bangladesh', None, "People's Republic of Bangladesh"),
+    ('BG', 'BGR', '100', 'Bulgaria', None, 'Republic of Bulgaria'),
+    ('BH', 'BHR', '048', 'Bahrain', None, 'Kingdom of Bahrain'),
+    ('BS', 'BHS', '044', 'Bahamas', None, 'Commonwealth of the Bahamas'),
+    ('BA', 'BIH', '070', 'Bosnia and Herzegovina', None, 'Republic of Bosnia and Herzegovina'),
+    ('BL', 'BLM', '652', 'Saint Barthélemy', None, None),
+    ('BY', 'BLR', '112', 'Belarus', None, 'Republic of Belarus'),
+    ('BZ', 'BLZ', '084', 'Belize', None, None),
+    ('BM', 'BMU', '060', 'Bermuda', None, None),
+    ('BO', 'BOL', '068', 'Bolivia, Plurinational State of', 'Bolivia', 'Plurinational State of Bolivia'),
+    ('BR', 'BRA', '076', 'Brazil', None, 'Federative Republic of Brazil'),
+    ('BB', 'BRB', '052', 'Barbados', None, None),
+    ('BN', 'BRN', '096', 'Brunei Darussalam', None, None),
+    ('BT', 'BTN', '064', 'Bhutan', None, 'Kingdom of Bhutan'),
+    ('BV', 'BVT', '074', 'Bouvet Island', None, None),
+    ('BW', 'BWA', '072', 'Botswana', None, 'Republic of Botswana'),
+    ('CF', 'CAF', '140', 'Central African Republic', None, None),
+    ('CA', 'CAN', '124', 'Canada', None, None),
+    ('CC', 'CCK', '166', 'Cocos (Keeling) Islands', None, None),
+    ('CH', 'CHE', '756', 'Switzerland', None, 'Swiss Confederation'),
+    ('CL', 'CHL', '152', 'Chile', None, 'Republic of Chile'),
+    ('CN', 'CHN', '156', 'China', None, "People's Republic of China"),
+    ('CI', 'CIV', '384', "Côte d'Ivoire", None, "Republic of Côte d'Ivoire"),
+    ('CM', 'CMR', '120', 'Cameroon', None, 'Republic of Cameroon'),
+    ('CD', 'COD', '180', 'Congo, The Democratic Republic of the', None, None),
+    ('CG', 'COG', '178', 'Congo', None, 'Republic of the Congo'),
+    ('CK', 'COK', '184', 'Cook Islands', None, None),
+    ('CO', 'COL', '170', 'Colombia', None, 'Republic of Colombia'),
+    ('KM', 'COM', '174', 'Comoros', None, 'Union of the Comoros'),
+    ('CV', 'CPV', '132', 'Cabo Verde', None, 'Republic of Cabo Verde'),
+    ('CR', 'CRI', '188', 'Costa Rica', None, 'Republic of Costa Rica'),
+    ('CU', 'CUB', '192', 'Cuba', None, 'Republic of Cuba'),
+    ('CW', 'CUW', '531', 'Curaçao', None, 'Curaçao'),
+    ('CX', 'CXR', '162', 'Christmas Island', None, None),
+    ('KY', 'CYM', '136', 'Cayman Islands', None, None),
+    ('CY', 'CYP', '196', 'Cyprus', None, 'Republic of Cyprus'),
+    ('CZ', 'CZE', '203', 'Czechia', None, 'Czech Republic'),
+    ('DE', 'DEU', '276', 'Germany', None, 'Federal Republic of Germany'),
+    ('DJ', 'DJI', '262', 'Djibouti', None, 'Republic of Djibouti'),
+    ('DM', 'DMA', '212', 'Dominica', None, 'Commonwealth of Dominica'),
+    ('DK', 'DNK', '208', 'Denmark', None, 'Kingdom of Denmark'),
+    ('DO', 'DOM', '214', 'Dominican Republic', None, None),
+    ('DZ', 'DZA', '012', 'Algeria', None, "People's Democratic Republic of Algeria"),
+    ('EC', 'ECU', '218', 'Ecuador', None, 'Republic of Ecuador'),
+    ('EG', 'EGY', '818', 'Egypt', None, 'Arab Republic of Egypt'),
+    ('ER', 'ERI', '232', 'Eritrea', None, 'the State of Eritrea'),
+    ('EH', 'ESH', '732', 'Western Sahara', None, None),
+    ('ES', 'ESP', '724', 'Spain', None, 'Kingdom of Spain'),
+    ('EE', 'EST', '233', 'Estonia', None, 'Republic of Estonia'),
+    ('ET', 'ETH', '231', 'Ethiopia', None, 'Federal Democratic Republic of Ethiopia'),
+    ('FI', 'FIN', '246', 'Finland', None, 'Republic of Finland'),
+    ('FJ', 'FJI', '242', 'Fiji', None, 'Republic of Fiji'),
+    ('FK', 'FLK', '238', 'Falkland Islands (Malvinas)', None, None),
+    ('FR', 'FRA', '250', 'France', None, 'French Republic'),
+    ('FO', 'FRO', '234', 'Faroe Islands', None, None),
+    ('FM', 'FSM', '583', 'Micronesia, Federated States of', None, 'Federated States of Micronesia'),
+    ('GA', 'GAB', '266', 'Gabon', None, 'Gabonese Republic'),
+    ('GB', 'GBR', '826', 'United Kingdom', None, 'United Kingdom of Great Britain and Northern Ireland'),
+    ('GE', 'GEO', '268', 'Georgia', None, None),
+    ('GG', 'GGY', '831', 'Guernsey', None, None),
+    ('GH', 'GHA', '288', 'Ghana', None, 'Republic of Ghana'),
+    ('GI', 'GIB', '292', 'Gibraltar', None, None),
+    ('GN', 'GIN', '324', 'Guinea', None, 'Republic of Guinea'),
+    ('GP', 'GLP', '312', 'Guadeloupe', None, None),
+    ('GM', 'GMB', '270', 'Gambia', None, 'Republic of the Gambia'),
+    ('GW', 'GNB', '624', 'Guinea-Bissau', None, 'Republic of Guinea-Bissau'),
+    ('GQ', 'GNQ', '226', 'Equatorial Guinea', None, 'Republic of Equatorial Guinea'),
+    ('GR', 'GRC', '300', 'Greece', None, 'Hellenic Republic'),
+    ('GD', 'GRD', '308', 'Grenada', None, None),
+    ('GL', 'GRL', '304', 'Greenland', None, None),
+    ('GT', 'GTM', '320', 'Guatemala', None, 'Republic of Guatemala'),
+    ('GF', 'GUF', '254', 'French Guiana', None, None),
+    ('GU', 'GUM', '316', 'Guam', None, None),
+    ('GY', 'GUY', '328', 'Guyana', None, 'Republic of Guyana'),
+    ('HK', 'HKG', '344', 'Hong Kong', None, 'Hong Kong Special Administrative Region of China'),
+    ('HM', 'HMD', '334', 'Heard Island and McDonald Islands', None, None),
+    ('HN', 'HND', '340', 'Honduras', None, 'Republic of Honduras'),
+    ('HR', 'HRV', '191', 'Croatia', None, 'Republic of Croatia'),
+    ('HT', 'HTI', '332', 'Haiti', None, 'Republic of Haiti'),
+    ('HU', 'HUN', '348', 'Hungary', None, 'Hungary'),
+    ('ID', 'IDN', '360', 'Indonesia', None, 'Republic of Indonesia'),
+    ('IM', 'IMN', '833', 'Isle of Man', None, None),
+    ('IN', 'IND', '356', 'India', None, 'Republic of India'),
+    ('IO', 'IOT', '086', 'British Indian Ocean Territory', None, None),
+    ('IE', 'IRL', '372', 'Ireland', None, None),
+    ('IR', 'IRN', '364', 'Iran, Islamic Republic of', 'Iran', 'Islamic Republic of Iran'),
+    ('IQ', 'IRQ', '368', 'Iraq', None, 'Republic of Iraq'),
+    ('IS', 'ISL', '352', 'Iceland', None, 'Republic of Iceland'),
+    ('IL', 'ISR', '376', 'Israel', None, 'State of Israel'),
+    ('IT', 'ITA', '380', 'Italy', None, 'Italian Republic'),
+    ('JM', 'JAM', '388', 'Jamaica', None, None),
+    ('JE', 'JEY', '832', 'Jersey', None, None),
+    ('JO', 'JOR', '400', 'Jordan', None, 'Hashemite Kingdom of Jordan'),
+    ('JP', 'JPN', '392', 'Japan', None, None),
+    ('KZ', 'KAZ', '398', 'Kazakhstan', None, 'Republic of Kazakhstan'),
+    ('KE', 'KEN', '404', 'Kenya', None, 'Republic of Kenya'),
+    ('KG', 'KGZ', '417', 'Kyrgyzstan', None, 'Kyrgyz Republic'),
+    ('KH', 'KHM', '116', 'Cambodia', None, 'Kingdom of Cambodia'),
+    ('KI', 'KIR', '296', 'Kiribati', None, 'Republic of Kiribati'),
+    ('KN', 'KNA', '659', 'Saint Kitts and Nevis', None, None),
+    ('KR', 'KOR', '410', 'Korea, Republic of', 'South Korea', None),
+    ('KW', 'KWT', '414', 'Kuwait', None, 'State of Kuwait'),
+    ('LA', 'LAO', '418', "Lao People's Democratic Republic", 'Laos', None),
+    ('LB', 'LBN', '422', 'Lebanon', None, 'Lebanese Republic'),
+    ('LR', 'LBR', '430', 'Liberia', None, 'Republic of Liberia'),
+    ('LY', 'LBY', '434', 'Libya', None, 'Libya'),
+    ('LC', 'LCA', '662', 'Saint Lucia', None, None),
+    ('LI', 'LIE', '438', 'Liechtenstein', None, 'Principality of Liechtenstein'),
+    ('LK', 'LKA', '144', 'Sri Lanka', None, 'Democratic Socialist Republic of Sri Lanka'),
+    ('LS', 'LSO', '426', 'Lesotho', None, 'Kingdom of Lesotho'),
+    ('LT', 'LTU', '440', 'Lithuania', None, 'Republic of Lithuania'),
+    ('LU', 'LUX', '442', 'Luxembourg', None, 'Grand Duchy of Luxembourg'),
+    ('LV', 'LVA', '428', 'Latvia', None, 'Republic of Latvia'),
+    ('MO', 'MAC', '446', 'Macao', None, 'Macao Special Administrative Region of China'),
+    ('MF', 'MAF', '663', 'Saint Martin (French part)', None, None),
+    ('MA', 'MAR', '504', 'Morocco', None, 'Kingdom of Morocco'),
+    ('MC', 'MCO', '492', 'Monaco', None, 'Principality of Monaco'),
+    ('MD', 'MDA', '498', 'Moldova, Republic of', 'Moldova', 'Republic of Moldova'),
+    ('MG', 'MDG', '450', 'Madagascar', None, 'Republic of Madagascar'),
+    ('MV', 'MDV', '462', 'Maldives', None, 'Republic of Maldives'),
+    ('MX', 'MEX', '484', 'Mexico', None, 'United Mexican States'),
+    ('MH', 'MHL', '584', 'Marshall Islands', None, 'Republic of the Marshall Islands'),
+    ('MK', 'MKD', '807', 'North Macedonia', None, 'Republic of North Macedonia'),
+    ('ML', 'MLI', '466', 'Mali', None, 'Republic of Mali'),
+    ('MT', 'MLT', '470', 'Malta', None, 'Republic of Malta'),
+    ('MM', 'MMR', '104', 'Myanmar', None, 'Republic of Myanmar'),
+    ('ME', 'MNE', '499', 'Montenegro', None, 'Montenegro'),
+    ('MN', 'MNG', '496', 'Mongolia', None, None),
+    ('MP', 'MNP', '580', 'Northern Mariana Islands', None, 'Commonwealth of the Northern Mariana Islands'),
+    ('MZ', 'MOZ', '508', 'Mozambique', None, 'Republic of Mozambique'),
+    ('MR', 'MRT', '478', 'Mauritania', None, 'Islamic Republic of Mauritania'),
+    ('MS', 'MSR', '500', 'Montserrat', None, None),
+    ('MQ', 'MTQ', '474', 'Martinique', None, None),
+    ('MU', 'MUS', '480', 'Mauritius', None, 'Republic of Mauritius'),
+    ('MW', 'MWI', '454', 'Malawi', None, 'Republic of Malawi'),
+    ('MY', 'MYS', '458', 'Malaysia', None, None),
+    ('YT', 'MYT', '175', 'Mayotte', None, None),
+    ('NA', 'NAM', '516', 'Namibia', None, 'Republic of Namibia'),
+    ('NC', 'NCL', '540', 'New Caledonia', None, None),
+    ('NE', 'NER', '562', 'Niger', None, 'Republic of the Niger'),
+    ('NF', 'NFK', '574', 'Norfolk Island', None, None),
+    ('NG', 'NGA', '566', 'Nigeria', None, 'Federal Republic of Nigeria'),
+    ('NI', 'NIC', '558', 'Nicaragua', None, 'Republic of Nicaragua'),
+    ('NU', 'NIU', '570', 'Niue', None, 'Niue'),
+    ('NL', 'NLD', '528', 'Netherlands', None, 'Kingdom of the Netherlands'),
+    ('NO', 'NOR', '578', 'Norway', None, 'Kingdom of Norway'),
+    ('NP', 'NPL', '524', 'Nepal', None, 'Federal Democratic Republic of Nepal'),
+    ('NR', 'NRU', '520', 'Nauru', None, 'Republic of Nauru'),
+    ('NZ', 'NZL', '554', 'New Zealand', None, None),
+    ('OM', 'OMN', '512', 'Oman', None, 'Sultanate of Oman'),
+    ('PK', 'PAK', '586', 'Pakistan', None, 'Islamic Republic of Pakistan'),
+    ('PA', 'PAN', '591', 'Panama', None, 'Republic of Panama'),
+    ('PN', 'PCN', '612', 'Pitcairn', None, None),
+    ('PE', 'PER', '604', 'Peru', None, 'Republic of Peru'),
+    ('PH', 'PHL', '608', 'Philippines', None, 'Republic of the Philippines'),
+    ('PW', 'PLW', '585', 'Palau', None, 'Republic of Palau'),
+    ('PG', 'PNG', '598', 'Papua New Guinea', None, 'Independent State of Papua New Guinea'),
+    ('PL', 'POL', '616', 'Poland', None, 'Republic of Poland'),
+    ('PR', 'PRI', '630', 'Puerto Rico', None, None),
+    ('KP', 'PRK', '408', "Korea, Democratic People's Republic of", 'North Korea', "Democratic People's Republic of Korea"),
+    ('PT', 'PRT', '620', 'Portugal', None, 'Portuguese Republic'),
+    ('PY', 'PRY', '600', 'Paraguay', None, 'Republic of Paraguay'),
+    ('PS', 'PSE', '275', 'Palestine, State of', None, 'the State of Palestine'),
+    ('PF', 'PYF', '258', 'French Polynesia', None, None),
+    ('QA', 'QAT', '634', 'Qatar', None, 'State of Qatar'),
+    ('RE', 'REU', '638', 'Réunion', None, None),
+    ('RO', 'ROU', '642', 'Romania', None, None),
+    ('RU', 'RUS', '643', 'Russian Federation', None, None),
+    ('RW', 'RWA', '646', 'Rwanda', None, 'Rwandese Republic'),
+    ('SA', 'SAU', '682', 'Saudi Arabia', None, 'Kingdom of Saudi Arabia'),
+    ('SD', 'SDN', '729', 'Sudan', None, 'Republic of the Sudan'),
+    ('SN', 'SEN', '686', 'Senegal', None, 'Republic of Senegal'),
+    ('SG', 'SGP', '702', 'Singapore', None, 'Republic of Singapore'),
+    ('GS', 'SGS', '239', 'South Georgia and the South Sandwich Islands', None, None),
+    ('SH', 'SHN', '654', 'Saint Helena, Ascension and Tristan da Cunha', None, None),
+    ('SJ', 'SJM', '744', 'Svalbard and Jan Mayen', None, None),
+    ('SB', 'SLB', '090', 'Solomon Islands', None, None),
+    ('SL', 'SLE', '694', 'Sierra Leone', None, 'Republic of Sierra Leone'),
+    ('SV', 'SLV', '222', 'El Salvador', None, 'Republic of El Salvador'),
+    ('SM', 'SMR', '674', 'San Marino', None, 'Republic of San Marino'),
+    ('SO', 'SOM', '706', 'Somalia', None, 'Federal Republic of Somalia'),
+    ('PM', 'SPM', '666', 'Saint Pierre and Miquelon', None, None),
+    ('RS', 'SRB', '688', 'Serbia', None, 'Republic of Serbia'),
+    ('SS', 'SSD', '728', 'South Sudan', None, 'Republic of South Sudan'),
+    ('ST', 'STP', '678', 'Sao Tome and Principe', None, 'Democratic Republic of Sao Tome and Principe'),
+    ('SR', 'SUR', '740', 'Suriname', None, 'Republic of Suriname'),
+    ('SK', 'SVK', '703', 'Slovakia', None, 'Slovak Republic'),
+    ('SI', 'SVN', '705', 'Slovenia', None, 'Republic of Slovenia'),
+    ('SE', 'SWE', '752', 'Sweden', None, 'Kingdom of Sweden'),
+    ('SZ', 'SWZ', '748', 'Eswatini', None, 'Kingdom of Eswatini'),
+    ('SX', 'SXM', '534', 'Sint Maarten (Dutch part)', None, 'Sint Maarten (Dutch part)'),
+    ('SC', 'SYC', '690', 'Seychelles', None, 'Republic of Seychelles'),
+    ('SY', 'SYR', '760', 'Syrian Arab Republic', 'Syria', None),
+    ('TC', 'TCA', '796', 'Turks and Caicos Islands', None, None),
+    ('TD', 'TCD', '148', 'Chad', None, 'Republic of Chad'),
+    ('TG', 'TGO', '768', 'Togo', None, 'Togolese Republic'),
+    ('TH', 'THA', '764', 'Thailand', None, 'Kingdom of Thailand'),
+    ('TJ', 'TJK', '762', 'Tajikistan', None, 'Republic of Tajikistan'),
+    ('TK', 'TKL', '772', 'Tokelau', None, None),
+    ('TM', 'TKM', '795', 'Turkmenistan', None, None),
+    ('TL', 'TLS', '626', 'Timor-Leste', None, 'Democratic Republic of Timor-Leste'),
+    ('TO', 'TON', '776', 'Tonga', None, 'Kingdom of Tonga'),
+    ('TT', 'TTO', '780', 'Trinidad and Tobago', None, 'Republic of Trinidad and Tobago'),
+    ('TN', 'TUN', '788', 'Tunisia', None, 'Republic of Tunisia'),
+    ('TR', 'TUR', '792', 'Türkiye', None, 'Republic of Türkiye'),
+    ('TV', 'TUV', '798', 'Tuvalu', None, None),
+    ('TW', 'TWN', '158', 'Taiwan, Province of China', 'Taiwan', 'Taiwan, Province of China'),
+    ('TZ', 'TZA', '834', 'Tanzania, United Republic of', 'Tanzania', 'United Republic of Tanzania'),
+    ('UG', 'UGA', '800', 'Uganda', None, 'Republic of Uganda'),
+    ('UA', 'UKR', '804', 'Ukraine', None, None),
+    ('UM', 'UMI', '581', 'United States Minor Outlying Islands', None, None),
+    ('UY', 'URY', '858', 'Uruguay', None, 'Eastern Republic of Uruguay'),
+    ('US', 'USA', '840', 'United States', None, 'United States of America'),
+    ('UZ', 'UZB', '860', 'Uzbekistan', None, 'Republic of Uzbekistan'),
+    ('VA', 'VAT', '336', 'Holy See (Vatican City State)', None, None),
+    ('VC', 'VCT', '670', 'Saint Vincent and the Grenadines', None, None),
+    ('VE', 'VEN', '862', 'Venezuela, Bolivarian Republic of', 'Venezuela', 'Bolivarian Republic of Venezuela'),
+    ('VG', 'VGB', '092', 'Virgin Islands, British', None, 'British Virgin Islands'),
+    ('VI', 'VIR', '850', 'Virgin Islands, U.S.', None, 'Virgin Islands of the United States'),
+    ('VN', 'VNM', '704', 'Viet Nam', 'Vietnam', 'Socialist Republic of Viet Nam'),
+    ('VU', 'VUT', '548', 'Vanuatu', None, 'Republic of Vanuatu'),
+    ('WF', 'WLF', '876', 'Wallis and Futuna', None, None),
+    ('WS', 'WSM', '882', 'Samoa', None, 'Independent State of Samoa'),
+    ('YE', 'YEM', '887', 'Yemen', None, 'Republic of Yemen'),
+    ('ZA', 'ZAF', '710', 'South Africa', None, 'Republic of South Africa'),
+    ('ZM', 'ZMB', '894', 'Zambia', None, 'Republic of Zambia'),
+    ('ZW', 'ZWE', '716', 'Zimbabwe', None, 'Republic of Zimbabwe'),
+)
@@ -5,8 +5,15 @@ This module provides functionality to parse location strings (e.g., "London, Eng
 and standardize country names to their official ISO 3166-1 names.
 """
 
+import inspect
+import json
 import re
-from typing import Optional, Dict, Union
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, List, Optional, Dict, Union
+
+from ._iso3166 import COUNTRIES
 
 try:
     import pycountry
@@ -14,6 +21,28 @@ try:
 except ImportError:
     PYCOUNTRY_AVAILABLE = False
 
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Newer pycountry releases can stop search_fuzzy() at the first match
+# instead of scoring and sorting every candidate
+_HAS_RETURN_FIRST = (
+    PYCOUNTRY_AVAILABLE
+    and 'return_first' in inspect.signature(pycountry.countries.search_fuzzy).parameters
+)
+
+
+# Comma separator between location parts, with the whitespace around it
+_SPLIT_RE = re.compile(r'\s*,\s*')
 
 # Mapping for special cases (e.g., England, Scotland, Wales to United Kingdom)
 COUNTRY_ALIASES = {
@@ -31,23 +60,118 @@ COUNTRY_ALIASES = {
 }
 
 
-def standardize_country_name(country: str) -> Optional[Dict[str, str]]:
+class CountryInfo(dict):
+    """
+    Standardized ISO 3166-1 country information from standardize_country_name().
+
+    A read-only dict with the keys 'name', 'alpha_2', 'alpha_3' and 'numeric',
+    so it compares, iterates and serializes like the dicts earlier versions
+    returned. Values can also be read as attributes (info.name), and
+    dict(info) gives a mutable copy.
+
+    Built from the four values in order, CountryInfo(name, alpha_2, alpha_3,
+    numeric), or like a dict from a mapping, key/value pairs or keywords, as
+    copy.deepcopy() and dataclasses.asdict() do.
+    """
+    __slots__ = ()
+
+    _FIELDS = ('name', 'alpha_2', 'alpha_3', 'numeric')
+
+    def __init__(self, *args, **kwargs):
+        if len(args) == len(self._FIELDS) and not kwargs:
+            values = dict(zip(self._FIELDS, args))
+        else:
+            values = dict(*args, **kwargs)
+            if values.keys() != set(self._FIELDS):
+                raise TypeError(f"CountryInfo needs exactly the keys {', '.join(self._FIELDS)}")
+        super().__init__((field, values[field]) for field in self._FIELDS)
+
+    @property
+    def name(self) -> str:
+        return self['name']
+
+    @property
+    def alpha_2(self) -> Optional[str]:
+        return self['alpha_2']
+
+    @property
+    def alpha_3(self) -> Optional[str]:
+        return self['alpha_3']
+
+    @property
+    def numeric(self) -> Optional[str]:
+        return self['numeric']
+
+    def __hash__(self):
+        return hash(tuple(self.values()))
+
+    def __reduce__(self):
+        # Rebuild through __init__, since the item setters are disabled
+        return (CountryInfo, tuple(self.values()))
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("CountryInfo is read-only; use dict(info) for a mutable copy")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+
+@dataclass(frozen=True, eq=False)
+class LocationResult(Mapping):
+    """
+    City and country parsed from a location string by parse_city_country().
+
+    Fields can be read as attributes (result.city) or, like the dicts earlier
+    versions returned, as a read-only mapping (result['city'],
+    'city' in result); dict(result) or result.copy() gives a plain dict.
+    Unlike those dicts it is not accepted by json.dumps(); serialize
+    dict(result), or use to_json_bytes().
+    """
+    __slots__ = ('city', 'country_input', 'country')
+
+    city: str
+    country_input: str
+    country: Union[CountryInfo, str, None]
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self.__slots__)
+
+    def __len__(self):
+        return len(self.__slots__)
+
+    def copy(self) -> Dict[str, Union[CountryInfo, str, None]]:
+        """Return the fields as a plain dict, like dict.copy() on earlier results."""
+        return dict(self)
+
+    def __reduce__(self):
+        # Frozen slotted instances cannot be restored by setting attributes
+        return (LocationResult, (self.city, self.country_input, self.country))
+
+
+def standardize_country_name(country: str) -> Optional[CountryInfo]:
     """
     Standardize a country name to its official ISO 3166-1 name.
 
-    This function uses the pycountry library to match country names (including
-    fuzzy matching) and returns standardized country information.
+    Exact names, ISO codes and aliases are matched against bundled ISO 3166-1
+    data; other inputs are fuzzy matched with rapidfuzz and/or the pycountry
+    library, whichever is installed. Returns standardized country information.
 
     Args:
         country: Country name to standardize (e.g., "England", "Sweden", "USA")
 
     Returns:
-        Dictionary containing standardized country information with keys:
+        CountryInfo containing standardized country information with fields:
         - 'name': Official country name (e.g., "United Kingdom")
         - 'alpha_2': ISO 3166-1 alpha-2 code (e.g., "GB")
         - 'alpha_3': ISO 3166-1 alpha-3 code (e.g., "GBR")
         - 'numeric': ISO 3166-1 numeric code (e.g., "826")
-        Returns None if country cannot be identified.
+        Returns None if country cannot be identified. The same CountryInfo is
+        shared by every call for a country; use dict(result) for a mutable copy.
 
     Examples:
         >>> result = standardize_country_name("England")
@@ -66,85 +190,121 @@ def standardize_country_name(country: str) -> Optional[Dict[str, str]]:
     if not country_clean:
         return None
 
-    # Check if pycountry is available
-    if not PYCOUNTRY_AVAILABLE:
-        # Fallback: return the input as-is if pycountry is not available
-        return {
-            'name': country_clean,
-            'alpha_2': None,
-            'alpha_3': None,
-            'numeric': None,
-        }
-
-    # Check aliases first (for England, Scotland, Wales, etc.)
+    # Aliases (for England, Scotland, Wales, etc.) are part of the index
+    country = _COUNTRY_INDEX.get(country_clean)
+    if country is not None:
+        return country
+
     country_upper = country_clean.upper()
-    if country_upper in COUNTRY_ALIASES:
-        country_clean = COUNTRY_ALIASES[country_upper]
+    country = _COUNTRY_INDEX.get(country_upper)
+    if country is not None:
+        return country
 
-    # Try exact match first
-    try:
-        country_obj = pycountry.countries.get(name=country_clean)
-        if country_obj:
-            return {
-                'name': country_obj.name,
-                'alpha_2': country_obj.alpha_2,
-                'alpha_3': country_obj.alpha_3,
-                'numeric': country_obj.numeric,
-            }
-    except (AttributeError, LookupError):
-        pass
-
-    # Try alpha-2 code match
-    try:
-        if len(country_clean) == 2:
-            country_obj = pycountry.countries.get(alpha_2=country_clean.upper())
-            if country_obj:
-                return {
-                    'name': country_obj.name,
-                    'alpha_2': country_obj.alpha_2,
-                    'alpha_3': country_obj.alpha_3,
-                    'numeric': country_obj.numeric,
-                }
-    except (AttributeError, LookupError):
-        pass
-
-    # Try alpha-3 code match
-    try:
-        if len(country_clean) == 3:
-            country_obj = pycountry.countries.get(alpha_3=country_clean.upper())
-            if country_obj:
-                return {
-                    'name': country_obj.name,
-                    'alpha_2': country_obj.alpha_2,
-                    'alpha_3': country_obj.alpha_3,
-                    'numeric': country_obj.numeric,
-                }
-    except (AttributeError, LookupError):
-        pass
-
-    # Try fuzzy matching
+    # Check if a fuzzy matcher is available
+    if not PYCOUNTRY_AVAILABLE and not RAPIDFUZZ_AVAILABLE:
+        # Fallback: return the input as-is if it cannot be fuzzy matched
+        return CountryInfo(country_clean, None, None, None)
+
+    return _fuzzy_country_name(country_upper)
+
+
+# Fields of each _iso3166.COUNTRIES row, which identify a country exactly, in
+# the order pycountry's lookup() tries them
+_COUNTRY_INDEX_FIELDS = ('alpha_2', 'alpha_3', 'numeric', 'name', 'common_name', 'official_name')
+
+
+def _build_country_index() -> Dict[str, CountryInfo]:
+    """
+    Map every upper-cased exact country identifier and alias to its country info.
+
+    Names are also registered as pycountry writes them (e.g., "Sweden") and
+    aliases in title case (e.g., "England"), mapped to the same info as their
+    upper-cased keys, so most inputs are found without case folding.
+    """
+    # One shared result per country
+    infos = {
+        alpha_2: CountryInfo(name, alpha_2, alpha_3, numeric)
+        for alpha_2, alpha_3, numeric, name, _, _ in COUNTRIES
+    }
+
+    index = {}
+    for position in range(len(_COUNTRY_INDEX_FIELDS)):
+        for row in COUNTRIES:
+            if row[position]:
+                index.setdefault(row[position].upper(), infos[row[0]])
+
+    # Aliases take precedence (for England, Scotland, Wales, etc.)
+    for alias, country_name in COUNTRY_ALIASES.items():
+        if country_name.upper() in index:
+            index[alias] = index[country_name.upper()]
+
+    for key in list(index):
+        if key in COUNTRY_ALIASES:
+            index.setdefault(key.title(), index[key])
+    for row in COUNTRIES:
+        for value in row:
+            if value:
+                index.setdefault(value, index[value.upper()])
+
+    return index
+
+
+_COUNTRY_INDEX = _build_country_index()
+
+# Upper-cased names and aliases to fuzzy match against; ISO codes are too
+# short to compare by edit distance
+_COUNTRY_NAMES = [key for key in _COUNTRY_INDEX if len(key) > 3 and key.isupper()]
+
+# Minimum rapidfuzz similarity (0-100) for a misspelled name to match
+_FUZZY_SCORE_CUTOFF = 85
+
+
+@lru_cache(maxsize=4096)
+def _fuzzy_country_name(country_upper: str) -> Optional[CountryInfo]:
+    """
+    Fuzzy match an upper-cased, stripped country name missing from _COUNTRY_INDEX.
+
+    Results (including misses) are cached since fuzzy search is slow and
+    rosters repeat the same inputs. Returns the shared country info from
+    _COUNTRY_INDEX, or None if the country cannot be identified.
+    """
+    # Catch misspellings (e.g., "Swedn") with rapidfuzz when it is installed
+    if RAPIDFUZZ_AVAILABLE:
+        match = process.extractOne(
+            country_upper, _COUNTRY_NAMES, scorer=fuzz.ratio, score_cutoff=_FUZZY_SCORE_CUTOFF
+        )
+        if match:
+            return _COUNTRY_INDEX[match[0]]
+
+    if not PYCOUNTRY_AVAILABLE:
+        return None
+
+    # Fall back to pycountry, which also matches subdivisions (e.g., "Texas")
     try:
-        matches = pycountry.countries.search_fuzzy(country_clean)
-        if matches:
-            # Return the first (best) match
-            country_obj = matches[0]
-            return {
-                'name': country_obj.name,
-                'alpha_2': country_obj.alpha_2,
-                'alpha_3': country_obj.alpha_3,
-                'numeric': country_obj.numeric,
-            }
+        if _HAS_RETURN_FIRST:
+            matches = pycountry.countries.search_fuzzy(country_upper, return_first=True)
+        else:
+            matches = pycountry.countries.search_fuzzy(country_upper)
     except LookupError:
-        pass
+        # If all matching fails, return None
+        return None
 
-    # If all matching fails, return None
-    return None
+    if isinstance(matches, list):
+        # Use the first (best) match
+        matches = matches[0] if matches else None
+
+    if not matches:
+        return None
+
+    return _COUNTRY_INDEX.get(matches.alpha_2) or CountryInfo(
+        matches.name, matches.alpha_2, matches.alpha_3, matches.numeric
+    )
 
 
 def parse_city_country(
     location: str,
     standardize: bool = True
-) -> Optional[Dict[str, Union[str, Dict[str, str]]]]:
+) -> Optional[LocationResult]:
     """
     Parse a location string to extract city and country names.
 
@@ -156,10 +316,11 @@ def parse_city_country(
         standardize: If True, standardize country names to ISO 3166-1 format (default: True)
 
     Returns:
-        Dictionary containing:
+        LocationResult containing:
         - 'city': City name (e.g., "London")
         - 'country_input': Original country string as provided (e.g., "England")
-        - 'country': Standardized country information dict (if standardize=True)
+        - 'country': Standardized CountryInfo from standardize_country_name()
+                     (if standardize=True)
                      or original country string (if standardize=False)
         Returns None if the location string cannot be parsed.
 
@@ -188,38 +349,93 @@ def parse_city_country(
     if not location:
         return None
 
-    location_clean = location.strip()
-    if not location_clean:
-        return None
-
-    # Split by comma - expecting format "City, Country"
-    parts = [part.strip() for part in location_clean.split(',')]
+    # Split on the last comma - expecting format "City, Country"
+    head, sep, tail = location.strip().rpartition(',')
 
     # We need at least 2 parts (city and country)
-    if len(parts) < 2:
+    if not sep:
         return None
 
     # Handle cases like "City, State, Country" by taking the last part as country
-    city = parts[0]
-    country_input = parts[-1]
-
-    # If there are more than 2 parts, join the middle parts with the city
+    # and keeping the earlier parts in the city, with consistent separators
     # Example: "New York, NY, USA" -> city="New York, NY", country="USA"
-    if len(parts) > 2:
-        city = ', '.join(parts[:-1])
+    city = head.strip()
+    if ',' in city:
+        city = _SPLIT_RE.sub(', ', city)
+    country_input = tail.strip()
 
     if not city or not country_input:
         return None
 
-    result = {
-        'city': city,
-        'country_input': country_input,
-    }
-
     if standardize:
-        country_info = standardize_country_name(country_input)
-        result['country'] = country_info
+        country = standardize_country_name(country_input)
     else:
-        result['country'] = country_input
+        country = country_input
+
+    return LocationResult(city, country_input, country)
+
+
+def parse_city_country_batch(
+    locations: Iterable[str],
+    standardize: bool = True
+) -> List[Optional[LocationResult]]:
+    """
+    Parse many location strings, e.g. a pandas Series of roster hometowns.
+
+    Each distinct location is parsed once with parse_city_country() and the
+    result is reused for every repeat, so this is much faster than
+    Series.apply(parse_city_country) on large rosters where a few thousand
+    hometowns cover most players. Rows with the same location share one
+    LocationResult.
+
+    Args:
+        locations: Iterable of location strings; missing values (None, NaN)
+                   and other non-string entries give None
+        standardize: If True, standardize country names to ISO 3166-1 format (default: True)
+
+    Returns:
+        List with the parse_city_country() result for each location, in order
+
+    Examples:
+        >>> results = parse_city_country_batch(["London, England", "Paris", "London, England"])
+        >>> [result['city'] if result else None for result in results]
+        ['London', None, 'London']
+    """
+    locations = list(locations)
+
+    results = {
+        location: parse_city_country(location, standardize=standardize)
+        for location in set(location for location in locations if isinstance(location, str))
+    }
+
+    return [
+        results[location] if isinstance(location, str) else None
+        for location in locations
+    ]
+
+
+def to_json_bytes(result: Optional[LocationResult]) -> bytes:
+    """
+    Serialize a parse_city_country() result to compact UTF-8 JSON.
+
+    Uses orjson, which serializes the dataclass natively and is several times
+    faster than the json module, when it is installed. The country is written
+    as an object with the CountryInfo field names.
+
+    Args:
+        result: A LocationResult, or None
+
+    Returns:
+        JSON document as bytes
+
+    Examples:
+        >>> to_json_bytes(parse_city_country("Tokyo, Japan", standardize=False))
+        b'{"city":"Tokyo","country_input":"Japan","country":"Japan"}'
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(result)
+
+    if result is not None:
+        result = dict(result)
 
-    return result
+    return json.dumps(result, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
@@ -0,0 +1,44 @@
+"""
+Generate location_utils/_iso3166.py from the installed pycountry database.
+
+The generated module lets location_utils resolve exact country names and
+codes without loading pycountry's JSON data at import time. Re-run it after
+upgrading pycountry:
+
+    python scripts/gen_iso.py
+"""
+
+from importlib.metadata import version
+from pathlib import Path
+
+import pycountry
+
+# Keep in sync with _COUNTRY_INDEX_FIELDS in location_utils/parser.py
+FIELDS = ('alpha_2', 'alpha_3', 'numeric', 'name', 'common_name', 'official_name')
+
+OUTPUT_PATH = Path(__file__).resolve().parent.parent / 'location_utils' / '_iso3166.py'
+
+HEADER = '''"""
+ISO 3166-1 country data.
+
+Generated by scripts/gen_iso.py from pycountry {version}; do not edit.
+"""
+
+# One row per country: {fields}
+COUNTRIES = (
+'''
+
+
+def main():
+    lines = [HEADER.format(version=version('pycountry'), fields=', '.join(FIELDS))]
+    for country in pycountry.countries:
+        row = tuple(getattr(country, field, None) for field in FIELDS)
+        lines.append(f'    {row!r},\n')
+    lines.append(')\n')
+
+    OUTPUT_PATH.write_text(''.join(lines), encoding='utf-8')
+    print(f"Wrote {len(pycountry.countries)} countries to {OUTPUT_PATH}")
+
+
+if __name__ == '__main__':
+    main()
@@ -36,6 +36,7 @@ setup(
     install_requires=[
         "pandas>=1.0.0",
         "pycountry>=22.3.5",
+        "requests>=2.26",
     ],
     extras_require={
         "dev": [
@@ -44,6 +45,15 @@ setup(
             "black",
             "flake8",
         ],
+        "fast": [
+            "numba>=0.56",
+            "regex>=2022.1.18",
+            "pyarrow>=7.0",
+            "rapidfuzz>=2.0",
+            "aiohttp>=3.8",
+            "selectolax>=0.3",
+            "orjson>=3.0",
+        ],
     },
     keywords="sports, high school, standardization, normalization, data cleaning, education, height, conversion, location parsing, country names",
     project_urls={
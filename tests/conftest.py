@@ -0,0 +1,17 @@
+"""
+Shared pytest fixtures.
+"""
+
+import pytest
+from location_utils import standardize_country_name
+
+
+# Test inputs that miss the exact country index and go through fuzzy search
+_FUZZY_COUNTRY_INPUTS = ("NotACountry123", "NotACountry")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_country_cache():
+    """Run the slow fuzzy country lookups once so tests hit the cache."""
+    for country in _FUZZY_COUNTRY_INPUTS:
+        standardize_country_name(country)
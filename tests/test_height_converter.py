@@ -2,8 +2,15 @@
 Tests for height conversion utilities
 """
 
+import numpy as np
+import pandas as pd
 import pytest
-from height_utils import height_to_inches, inches_to_height_str
+from height_utils import (
+    height_to_inches,
+    heights_to_inches,
+    heights_to_inches_nb,
+    inches_to_height_str,
+)
 
 
 class TestHeightToInches:
@@ -101,6 +108,61 @@ class TestHeightToInches:
         assert height_to_inches("10-6") == 126  # Very tall
 
 
+class TestHeightsToInches:
+    """Test suite for heights_to_inches function"""
+
+    def test_mixed_formats(self):
+        """Test a Series mixing all supported formats"""
+        heights = pd.Series([
+            "5-10", "5 - 10", "6'2\"", "5'10", "6′2″", "6'", "6 ft 2 in",
+            "5 feet 11 inches", "6 FT", "72 in", "71", 72, 71.5,
+        ])
+        result = heights_to_inches(heights)
+        assert result.tolist() == [70, 70, 74, 70, 74, 72, 74, 71, 72, 72, 71, 72, 72]
+
+    def test_matches_scalar_conversion(self):
+        """Test that results agree with height_to_inches element-wise"""
+        heights = pd.Series(["5-10", "6'2\"", "5ft10in", "74in", "0-0", "10-6", " 72 ", "70.2"])
+        expected = [height_to_inches(h) for h in heights]
+        assert heights_to_inches(heights).tolist() == expected
+
+    def test_invalid_values_are_na(self):
+        """Test invalid and missing values become <NA>"""
+        heights = pd.Series(["invalid", "5'10'11", "", "   ", None])
+        result = heights_to_inches(heights)
+        assert result.isna().all()
+
+    def test_preserves_index_and_dtype(self):
+        """Test the result keeps the input index and uses nullable integers"""
+        heights = pd.Series(["5-10", "bad"], index=["alice", "bob"])
+        result = heights_to_inches(heights)
+        assert result.index.tolist() == ["alice", "bob"]
+        assert str(result.dtype) == "Int64"
+        assert result["alice"] == 70
+        assert pd.isna(result["bob"])
+
+
+class TestHeightsToInchesNb:
+    """Test suite for heights_to_inches_nb function"""
+
+    def test_pre_normalized_formats(self):
+        """Test the 'NN' and 'N-NN' shapes"""
+        heights = np.array([b"5-10", b"6-2", b"6-0", b"72", b"7", b"0-0"])
+        result = heights_to_inches_nb(heights)
+        assert result.dtype == np.int8
+        assert result.tolist() == [70, 74, 72, 72, 7, 0]
+
+    def test_other_shapes_are_invalid(self):
+        """Test that anything outside the fixed shapes returns -1"""
+        heights = np.array([b"6'2", b"5 - 10", b"10-6", b"5-", b"", b"abc", b"128"])
+        assert heights_to_inches_nb(heights).tolist() == [-1] * 7
+
+    def test_series_bytes_input(self):
+        """Test input produced from a pandas Series"""
+        heights = pd.Series(["5-10", "71"]).astype("|S8").to_numpy()
+        assert heights_to_inches_nb(heights).tolist() == [70, 71]
+
+
 class TestInchesToHeightStr:
     """Test suite for inches_to_height_str function"""
 
@@ -0,0 +1,198 @@
+"""
+Tests for high school mapping and standardization utilities.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from hs_standardization import (
+    apply_mapping,
+    build_complete_mapping,
+    create_duplicate_mapping,
+    normalize_hs_name,
+    select_canonical_name,
+)
+
+
+@pytest.fixture
+def schools_df():
+    """Unique schools with name variants in several states."""
+    df = pd.DataFrame({
+        'high_school_original': [
+            'Central HS', 'Central High School', 'Central H.S.', 'Central HS',
+            'Lincoln HS', 'Lincoln High School', 'St. Mary HS', 'Saint Mary HS',
+            'Spire Academy', 'Zed HS', None,
+        ],
+        'state': ['CA', 'CA', 'CA', 'NV', 'TX', 'TX', 'NY', 'NY', 'OH', None, 'CA'],
+        'player_count': [10, 15, 15, 2, 3, 3, 4, 4, 6, 1, 1],
+    })
+    df['high_school_normalized'] = df['high_school_original'].apply(normalize_hs_name)
+    df.loc[df['high_school_original'].isna(), 'high_school_normalized'] = np.nan
+    return df
+
+
+def _standardized(mapping, original, state):
+    rows = mapping[(mapping['high_school_original'] == original) & (mapping['state'] == state)]
+    assert len(rows) == 1
+    return rows.iloc[0]
+
+
+class TestSelectCanonicalName:
+    """Tests for select_canonical_name function."""
+
+    @pytest.mark.parametrize("names,counts,expected", [
+        (['Central HS', 'Central High School', 'Central H.S.'], [10, 15, 5], 'Central High School'),
+        (['Central HS', 'Central High School', 'Central H.S.'], [10, 15, 15], 'Central H.S.'),
+        (['Lincoln HS', 'Lincoln High School'], [3, 3], 'Lincoln High School'),
+        (['St. Mary HS', 'Saint Mary HS'], [4, 4], 'Saint Mary HS'),
+    ])
+    def test_preference_order(self, names, counts, expected):
+        """Test count, then suffix style, then alphabetical tie breaking."""
+        group = pd.DataFrame({'high_school_original': names, 'player_count': counts},
+                             index=range(10, 10 + len(names)))
+        canonical = select_canonical_name(group)
+        assert canonical['high_school_original'] == expected
+        assert canonical.name == group.index[names.index(expected)]
+
+
+class TestCreateDuplicateMapping:
+    """Tests for create_duplicate_mapping function."""
+
+    def test_canonical_names(self, schools_df):
+        """Test that every variant maps to the canonical name of its group."""
+        mapping = create_duplicate_mapping(schools_df)
+        row = _standardized(mapping, 'Central HS', 'CA')
+        assert row['high_school_standardized'] == 'Central H.S.'
+        assert row['source'] == 'duplicate_resolution'
+        assert row['player_count'] == 10
+        assert row['canonical_player_count'] == 15
+        assert _standardized(mapping, 'Lincoln HS', 'TX')['high_school_standardized'] == 'Lincoln High School'
+        assert _standardized(mapping, 'St. Mary HS', 'NY')['high_school_standardized'] == 'Saint Mary HS'
+        assert (mapping['confidence'] == 'high_auto').all()
+
+    def test_single_variants(self, schools_df):
+        """Test that schools without variants map to themselves."""
+        mapping = create_duplicate_mapping(schools_df)
+        row = _standardized(mapping, 'Central HS', 'NV')
+        assert row['high_school_standardized'] == 'Central HS'
+        assert row['source'] == 'no_variation'
+        assert row['canonical_player_count'] == 2
+
+    def test_missing_keys_dropped(self, schools_df):
+        """Test that rows with a missing name or state get no mapping."""
+        mapping = create_duplicate_mapping(schools_df)
+        assert len(mapping) == len(schools_df) - 2
+        assert 'Zed HS' not in mapping['high_school_original'].tolist()
+        assert mapping['high_school_original'].notna().all()
+
+    def test_without_state(self, schools_df):
+        """Test grouping variants across states."""
+        mapping = create_duplicate_mapping(schools_df, group_by_state=False)
+        row = _standardized(mapping, 'Central HS', 'NV')
+        assert row['high_school_standardized'] == 'Central H.S.'
+        assert row['canonical_player_count'] == 15
+        assert 'Zed HS' in mapping['high_school_original'].tolist()
+
+    def test_matches_select_canonical_name(self, schools_df):
+        """Test each group's canonical name against select_canonical_name."""
+        mapping = create_duplicate_mapping(schools_df)
+        for _, group in schools_df.dropna(subset=['high_school_normalized', 'state']).groupby(
+                ['high_school_normalized', 'state']):
+            expected = select_canonical_name(group)['high_school_original']
+            for original, state in zip(group['high_school_original'], group['state']):
+                assert _standardized(mapping, original, state)['high_school_standardized'] == expected
+
+    def test_grouped_order(self, schools_df):
+        """Test that rows come out grouped by normalized name and state."""
+        mapping = create_duplicate_mapping(schools_df)
+        assert mapping['high_school_original'].tolist() == [
+            'Central HS', 'Central High School', 'Central H.S.', 'Central HS',
+            'Lincoln HS', 'Lincoln High School', 'St. Mary HS', 'Saint Mary HS',
+            'Spire Academy',
+        ]
+
+
+class TestApplyMapping:
+    """Tests for apply_mapping function."""
+
+    @pytest.fixture
+    def mapping_df(self):
+        return pd.DataFrame({
+            'high_school_original': ['Central HS', 'Lincoln HS', 'Lincoln HS'],
+            'high_school_standardized': ['Central H.S.', 'Lincoln High', 'Lincoln High School'],
+            'confidence': ['high_auto', 'high_auto', 'high_manual'],
+        })
+
+    @pytest.fixture
+    def players_df(self):
+        return pd.DataFrame({
+            'player': ['A', 'B', 'C', 'D'],
+            'high_school': ['Central HS', 'Unknown School', np.nan, 'Lincoln HS'],
+        }, index=[5, 6, 7, 8])
+
+    def test_apply(self, players_df, mapping_df):
+        """Test mapped, unmapped and missing names."""
+        result = apply_mapping(players_df, mapping_df)
+        assert result['high_school_standardized'].tolist()[:2] == ['Central H.S.', 'Unknown School']
+        assert pd.isna(result.loc[7, 'high_school_standardized'])
+        # Later mapping rows win
+        assert result.loc[8, 'high_school_standardized'] == 'Lincoln High School'
+        assert result['hs_confidence'].tolist() == [
+            'high_auto', 'unstandardized', 'unstandardized', 'high_manual'
+        ]
+        assert result.loc[[5, 6, 8], 'hs_was_standardized'].tolist() == [True, False, True]
+        assert result.index.equals(players_df.index)
+
+    def test_not_inplace(self, players_df, mapping_df):
+        """Test that the caller's frame is left untouched by default."""
+        before = players_df.copy()
+        result = apply_mapping(players_df, mapping_df)
+        assert result is not players_df
+        pd.testing.assert_frame_equal(players_df, before)
+
+    def test_inplace(self, players_df, mapping_df):
+        """Test adding the columns to the caller's frame."""
+        result = apply_mapping(players_df, mapping_df, inplace=True)
+        assert result is players_df
+        assert players_df['high_school_standardized'].iloc[0] == 'Central H.S.'
+
+    def test_without_confidence(self, players_df, mapping_df):
+        """Test a mapping without a confidence column."""
+        result = apply_mapping(players_df, mapping_df.drop(columns='confidence'))
+        assert 'hs_confidence' not in result.columns
+        assert result.loc[5, 'high_school_standardized'] == 'Central H.S.'
+
+    def test_custom_columns(self, players_df, mapping_df):
+        """Test custom column names."""
+        players = players_df.rename(columns={'high_school': 'school'})
+        result = apply_mapping(players, mapping_df, original_col='school',
+                               standardized_col='school_std', confidence_col='conf',
+                               changed_col='changed')
+        assert result.columns.tolist() == ['player', 'school', 'school_std', 'conf', 'changed']
+
+
+class TestBuildCompleteMapping:
+    """Tests for build_complete_mapping function."""
+
+    def test_prep_schools_take_precedence(self, schools_df):
+        """Test that curated prep school rows replace duplicate resolution."""
+        mapping = build_complete_mapping(schools_df)
+        spire = mapping[mapping['high_school_original'] == 'Spire Academy']
+        assert spire['high_school_standardized'].tolist() == ['Spire Institute']
+        assert spire['source'].tolist() == ['prep_school_curated']
+        assert 'IMG Academy' in mapping['high_school_original'].tolist()
+        assert mapping.index.equals(pd.RangeIndex(len(mapping)))
+
+    def test_without_prep_schools(self, schools_df):
+        """Test that only duplicate resolution is used when asked."""
+        mapping = build_complete_mapping(schools_df, include_prep_schools=False)
+        pd.testing.assert_frame_equal(mapping, create_duplicate_mapping(schools_df))
+
+    def test_unmapped_pass_through(self, schools_df):
+        """Test applying the complete mapping to names it does not cover."""
+        players = pd.DataFrame({'high_school': ['Central HS', 'Nowhere HS', 'Spire Academy']})
+        result = apply_mapping(players, build_complete_mapping(schools_df))
+        assert result['high_school_standardized'].tolist() == [
+            'Central HS', 'Nowhere HS', 'Spire Institute'
+        ]
+        assert result['hs_confidence'].tolist() == ['high_auto', 'unstandardized', 'high_manual']
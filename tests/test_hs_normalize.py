@@ -0,0 +1,130 @@
+"""
+Tests for high school name normalization utilities.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from hs_standardization import (
+    categorize_school_type,
+    categorize_school_type_series,
+    normalize_hs_name,
+    normalize_hs_name_series,
+)
+
+
+# Names covering missing values, suffix runs, St./Saint and parenthetical notes
+NAMES = [
+    None,
+    np.nan,
+    '',
+    '   ',
+    'Central High School',
+    'central hs',
+    "St. Mary's H.S.",
+    'ST. JOHN HS',
+    'Mount St. Joseph',
+    'ST HS',
+    'St. HS',
+    'St High School',
+    'Stanton HS',
+    'Lincoln HS (North)',
+    'Tappan Zee (Saint Rose)',
+    'Central (A) (B)',
+    'Central HS High School',
+    'Central H.S HS H.S. High School',
+    'Central High School HS',
+    'East  West   HS',
+    ' North  ',
+    "Bishop  O'Dowd",
+    'HS',
+    'High School',
+    'IES Madrid',
+    'IMG Academy',
+    'Central Catholic',
+    'St. Joseph Prep',
+    'Lycee Francais',
+    'College Heights',
+    'Niederwald Gymnasium',
+    'Westlake',
+    12345,
+]
+
+
+class TestNormalizeHsName:
+    """Tests for normalize_hs_name function."""
+
+    @pytest.mark.parametrize("name,expected", [
+        ("Central High School", "CENTRAL"),
+        ("St. Mary's H.S.", "SAINT MARYS"),
+        ("Lincoln HS (North)", "LINCOLN HS"),
+        ("Central HS High School", "CENTRAL"),
+        ("Central High School HS", "CENTRAL HIGH SCHOOL"),
+        ("Mount St. Joseph", "MOUNT SAINT JOSEPH"),
+        ("ST HS", "ST"),
+        ("St High School", "ST"),
+        ("", ""),
+        (None, ""),
+    ])
+    def test_normalize(self, name, expected):
+        """Test normalization of suffixes, St./Saint and notes."""
+        assert normalize_hs_name(name) == expected
+
+
+class TestNormalizeHsNameSeries:
+    """Tests for normalize_hs_name_series function."""
+
+    @pytest.mark.parametrize("name", NAMES)
+    def test_matches_scalar(self, name):
+        """Test that each name normalizes like normalize_hs_name."""
+        names = pd.Series([name], dtype=object)
+        assert normalize_hs_name_series(names).tolist() == [normalize_hs_name(name)]
+
+    def test_matches_apply(self):
+        """Test the whole Series against .apply(normalize_hs_name)."""
+        names = pd.Series(NAMES, dtype=object, index=range(100, 100 + len(NAMES)))
+        result = normalize_hs_name_series(names)
+        expected = names.apply(normalize_hs_name)
+        assert result.tolist() == expected.tolist()
+        assert result.index.equals(names.index)
+
+    def test_string_dtype(self):
+        """Test a pandas string Series with missing values."""
+        names = pd.Series(['Central HS', None, 'St. Mary HS'], dtype='string')
+        assert normalize_hs_name_series(names).tolist() == ['CENTRAL', '', 'SAINT MARY']
+
+
+class TestCategorizeSchoolType:
+    """Tests for categorize_school_type function."""
+
+    @pytest.mark.parametrize("name,expected", [
+        ("IMG Academy", "prep"),
+        ("St. Joseph Prep", "prep"),
+        ("St. Mary's Catholic School", "private"),
+        ("Bishop O'Dowd", "private"),
+        ("Lycee Francais", "international"),
+        ("Central High School", "public"),
+        ("Westlake", "unknown"),
+        (None, "unknown"),
+    ])
+    def test_categorize(self, name, expected):
+        """Test that the first matching school type wins."""
+        assert categorize_school_type(name) == expected
+
+
+class TestCategorizeSchoolTypeSeries:
+    """Tests for categorize_school_type_series function."""
+
+    @pytest.mark.parametrize("name", NAMES)
+    def test_matches_scalar(self, name):
+        """Test that each name is categorized like categorize_school_type."""
+        names = pd.Series([name], dtype=object)
+        assert categorize_school_type_series(names).tolist() == [categorize_school_type(name)]
+
+    def test_matches_apply(self):
+        """Test the whole Series against .apply(categorize_school_type)."""
+        names = pd.Series(NAMES, dtype=object, index=range(100, 100 + len(NAMES)))
+        result = categorize_school_type_series(names)
+        expected = names.apply(categorize_school_type)
+        assert result.tolist() == expected.tolist()
+        assert result.index.equals(names.index)
@@ -2,8 +2,19 @@
 Tests for location parsing utilities.
 """
 
+import copy
+import dataclasses
+import json
+
+import pandas as pd
 import pytest
-from location_utils import parse_city_country, standardize_country_name
+from location_utils import (
+    CountryInfo,
+    parse_city_country,
+    parse_city_country_batch,
+    standardize_country_name,
+    to_json_bytes,
+)
 
 
 class TestStandardizeCountryName:
@@ -82,6 +93,47 @@ class TestStandardizeCountryName:
         assert standardize_country_name("   ") is None
         assert standardize_country_name(None) is None
 
+    def test_attribute_and_key_access(self):
+        """Test that results support attribute, key and dict access."""
+        result = standardize_country_name("Sweden")
+        assert result.name == result['name'] == "Sweden"
+        assert result.alpha_3 == result['alpha_3'] == "SWE"
+        assert dict(result) == {
+            'name': "Sweden", 'alpha_2': "SE", 'alpha_3': "SWE", 'numeric': "752"
+        }
+        with pytest.raises(KeyError):
+            result['capital']
+
+    def test_dict_compatibility(self):
+        """Test that results behave like the plain dicts earlier versions returned."""
+        result = standardize_country_name("Sweden")
+        expected = {'name': "Sweden", 'alpha_2': "SE", 'alpha_3': "SWE", 'numeric': "752"}
+        assert result == expected
+        assert 'name' in result
+        assert 'Sweden' not in result
+        assert list(result) == ['name', 'alpha_2', 'alpha_3', 'numeric']
+        assert result.get('capital') is None
+        assert json.loads(json.dumps(result)) == expected
+
+    def test_dict_constructor(self):
+        """Test that CountryInfo can be rebuilt the way dict rebuilds dicts."""
+        result = standardize_country_name("Sweden")
+        for rebuilt in (CountryInfo(result), CountryInfo(result.items()), CountryInfo(**result),
+                        CountryInfo("Sweden", "SE", "SWE", "752"), copy.deepcopy(result)):
+            assert isinstance(rebuilt, CountryInfo)
+            assert rebuilt == result and list(rebuilt) == list(result)
+        with pytest.raises(TypeError):
+            CountryInfo({'name': "Sweden"})
+
+    def test_read_only(self):
+        """Test that shared results cannot be modified."""
+        result = standardize_country_name("Sweden")
+        with pytest.raises(TypeError):
+            result['name'] = "Norway"
+        with pytest.raises(TypeError):
+            result.update(name="Norway")
+        assert standardize_country_name("Sweden")['name'] == "Sweden"
+
     def test_case_insensitive(self):
         """Test that country name matching is case-insensitive."""
         result = standardize_country_name("england")
@@ -212,6 +264,81 @@ class TestParseCityCountry:
         assert result['country_input'] == "NotACountry"
         assert result['country'] is None  # Country standardization failed
 
+    def test_attribute_access(self):
+        """Test that results support attribute access and dict conversion."""
+        result = parse_city_country("Tokyo, Japan", standardize=False)
+        assert result.city == "Tokyo"
+        assert result.country == "Japan"
+        assert dict(result) == {'city': "Tokyo", 'country_input': "Japan", 'country': "Japan"}
+
+    def test_mapping_compatibility(self):
+        """Test that results behave like the plain dicts earlier versions returned."""
+        result = parse_city_country("London, England")
+        assert 'country' in result
+        assert 'London' not in result
+        assert list(result) == ['city', 'country_input', 'country']
+        assert dict(result) == {
+            'city': "London",
+            'country_input': "England",
+            'country': {'name': "United Kingdom", 'alpha_2': "GB", 'alpha_3': "GBR", 'numeric': "826"},
+        }
+        assert result == dict(result)
+        assert result.get('region') is None
+        assert json.loads(json.dumps(dict(result)))['country']['name'] == "United Kingdom"
+
+    def test_copy_and_json(self):
+        """Test the plain dict copy and its JSON serialization."""
+        result = parse_city_country("London, England")
+        plain = result.copy()
+        assert type(plain) is dict and plain == dataclasses.asdict(result)
+        plain['city'] = "Leeds"
+        assert result.city == "London"
+        assert json.loads(json.dumps({'loc': dict(result)}))['loc']['country']['alpha_3'] == "GBR"
+        with pytest.raises(TypeError):
+            json.dumps(result)
+
+    def test_asdict_and_dataframe(self):
+        """Test dataclasses.asdict() and DataFrame rows with a resolved country."""
+        results = [parse_city_country("London, England"), parse_city_country("SomeCity, NotACountry")]
+        expected = {
+            'city': "London",
+            'country_input': "England",
+            'country': {'name': "United Kingdom", 'alpha_2': "GB", 'alpha_3': "GBR", 'numeric': "826"},
+        }
+        assert dataclasses.asdict(results[0]) == expected
+        df = pd.DataFrame(results)
+        assert df.columns.tolist() == ['city', 'country_input', 'country']
+        assert df.loc[0, 'country'] == expected['country']
+        assert df.loc[1, 'city'] == "SomeCity"
+
+    def test_to_json_bytes(self):
+        """Test JSON serialization of parse results."""
+        data = json.loads(to_json_bytes(parse_city_country("Zürich, Switzerland")))
+        assert data['city'] == "Zürich"
+        assert data['country']['alpha_2'] == "CH"
+        assert json.loads(to_json_bytes(parse_city_country("SomeCity, NotACountry")))['country'] is None
+
+
+class TestParseCityCountryBatch:
+    """Tests for parse_city_country_batch function."""
+
+    def test_matches_single_parse(self):
+        """Test that batch results match parse_city_country for each location."""
+        locations = ["London, England", "Paris", "Tokyo, Japan", "London, England", ""]
+        results = parse_city_country_batch(locations)
+        assert results == [parse_city_country(location) for location in locations]
+
+    def test_without_standardization(self):
+        """Test batch parsing without country standardization."""
+        results = parse_city_country_batch(["Stockholm, Sweden"], standardize=False)
+        assert results[0]['country'] == "Sweden"
+
+    def test_missing_values(self):
+        """Test that missing values in a pandas Series give None."""
+        results = parse_city_country_batch(pd.Series(["Rome, Italy", None, float('nan')]))
+        assert results[0]['country']['name'] == "Italy"
+        assert results[1:] == [None, None]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
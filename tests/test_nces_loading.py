@@ -0,0 +1,90 @@
+"""
+Tests for NCES CSV loading.
+"""
+
+import io
+from contextlib import redirect_stdout
+
+import pandas as pd
+import pytest
+from hs_standardization import load_and_prepare_all_nces, load_ccd_data
+from hs_standardization import nces_data
+
+
+def _write_ccd(path, tail=b''):
+    # Well past the 64KB head that the encoding is detected from
+    rows = ['NCESSCH,SCH_NAME,LSTREET1,LSTREET3,LCITY,LSTATE,LEVEL']
+    rows += [f'{i:012d},School {i} High School,{i} Main St,,Town{i % 3},CA,{3 if i % 2 else 13}'
+             for i in range(4000)]
+    path.write_bytes(('\n'.join(rows) + '\n').encode() + tail)
+    return path
+
+
+class TestLoadCcdDataArrow:
+    """Tests for loading CCD files with the pyarrow CSV reader."""
+
+    @pytest.fixture(autouse=True)
+    def _pyarrow(self):
+        pytest.importorskip("pyarrow")
+
+    def test_arrow_dtypes(self, tmp_path):
+        """Test that text stays Arrow-backed and IDs keep their leading zeros."""
+        df = load_ccd_data(_write_ccd(tmp_path / 'ccd_directory_2023.csv'))
+        assert len(df) == 2000
+        assert isinstance(df['SCH_NAME'].dtype, pd.ArrowDtype)
+        assert df['NCESSCH'].iloc[0] == '000000000001'
+        assert df['LSTATE'].dtype == 'category'
+        # An all-empty column is read as text
+        assert isinstance(df['LSTREET3'].dtype, pd.ArrowDtype)
+        assert df['LSTREET3'].isna().all()
+
+    @pytest.mark.parametrize("tail", [
+        b'000000009999,Caf\xe9 High School,1 St,,Town,CA,3\n',
+        b'00000000\xe999,Cafe High School,1 St,,Town,CA,3\n',
+    ])
+    def test_latin1_after_head(self, tmp_path, tail):
+        """Test the latin1 fallback for bytes past the sniffed head."""
+        df = load_ccd_data(_write_ccd(tmp_path / 'ccd_directory_2023.csv', tail))
+        assert len(df) == 2001
+        assert df['SCH_NAME'].iloc[-1] == tail.split(b',')[1].decode('latin1')
+        assert df['NCESSCH'].iloc[-1] == tail.split(b',')[0].decode('latin1')
+
+
+class TestPreparedCache:
+    """Tests for the prepared NCES data cache."""
+
+    def _load(self, data_dir, **kwargs):
+        with redirect_stdout(io.StringIO()):
+            return load_and_prepare_all_nces(data_dir=str(data_dir), **kwargs)
+
+    def test_off_by_default(self, tmp_path):
+        """Test that nothing is written unless the cache is enabled."""
+        _write_ccd(tmp_path / 'ccd_directory_2023.csv')
+        self._load(tmp_path)
+        assert not (tmp_path / '.cache').exists()
+
+    def test_reuse(self, tmp_path, monkeypatch):
+        """Test that a second load reads the cache instead of the CSV file."""
+        _write_ccd(tmp_path / 'ccd_directory_2023.csv')
+        first = self._load(tmp_path, use_cache=True)
+        assert len(list((tmp_path / '.cache').iterdir())) == 1
+
+        def fail(*args, **kwargs):
+            raise AssertionError("CSV file parsed again")
+
+        monkeypatch.setattr(nces_data, 'load_ccd_data', fail)
+        cached = self._load(tmp_path, use_cache=True)
+        assert cached['nces_id'].tolist() == first['nces_id'].tolist()
+        assert cached['school_name_normalized'].tolist() == first['school_name_normalized'].tolist()
+
+    def test_version_change(self, tmp_path, monkeypatch):
+        """Test that caches of other layout versions are rebuilt and dropped."""
+        _write_ccd(tmp_path / 'ccd_directory_2023.csv')
+        self._load(tmp_path, use_cache=True)
+        old = list((tmp_path / '.cache').iterdir())
+
+        monkeypatch.setattr(nces_data, '_PREPARED_CACHE_VERSION',
+                            nces_data._PREPARED_CACHE_VERSION + 1)
+        self._load(tmp_path, use_cache=True)
+        new = list((tmp_path / '.cache').iterdir())
+        assert len(new) == 1 and new != old
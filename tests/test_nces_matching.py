@@ -0,0 +1,184 @@
+"""
+Tests for NCES lookup and matching utilities.
+"""
+
+import json
+
+import pandas as pd
+import pytest
+from hs_standardization import batch_match_to_nces, create_nces_lookup, match_to_nces
+from hs_standardization.nces_data import NCESRecord, prepare_nces_for_matching
+
+
+@pytest.fixture
+def nces_df():
+    """A small prepared CCD frame with repeated school names."""
+    raw = pd.DataFrame({
+        'NCESSCH': ['060000100001', '060000100002', '480000100003',
+                    '480000100004', '170000100005', '360000100006'],
+        'SCH_NAME': ['Central High School', 'Central High School', 'Central High School',
+                     'Central High School', 'Lincoln High School', 'St. Mary Academy'],
+        'LSTREET1': ['1 Main St', '2 Oak Ave', '3 Elm St', '4 Pine Rd', '5 Lake Dr', '6 Hill St'],
+        'LCITY': ['Fresno', 'Oakland', 'Austin', 'Dallas', 'Chicago', 'Albany'],
+        'LSTATE': ['CA', 'CA', 'TX', 'TX', 'IL', 'NY'],
+        'LZIP': ['93701', '94601', '73301', '75201', '60601', '12201'],
+    })
+    return prepare_nces_for_matching(raw, source='ccd')
+
+
+def _legacy_lookup(nces_df):
+    """The dictionary of school dictionaries built by earlier versions."""
+    lookup = {}
+    for _, row in nces_df.iterrows():
+        lookup.setdefault(row['school_name_normalized'], []).append({
+            'nces_id': row['nces_id'],
+            'name': row['school_name_original'],
+            'street': row['street'],
+            'city': row['city'],
+            'state': row['state'],
+            'zip': row['zip'],
+            'source': row['source'],
+        })
+    return lookup
+
+
+class TestCreateNcesLookup:
+    """Tests for create_nces_lookup function."""
+
+    def test_groups_by_normalized_name(self, nces_df):
+        """Test that schools are grouped under their normalized name."""
+        lookup = create_nces_lookup(nces_df)
+        assert sorted(lookup) == ['CENTRAL', 'LINCOLN', 'SAINT MARY ACADEMY']
+        assert len(lookup['CENTRAL']) == 4
+
+    def test_records_read_by_field_name(self, nces_df):
+        """Test that records still support school dictionary access."""
+        record = create_nces_lookup(nces_df)['LINCOLN'][0]
+        assert isinstance(record, NCESRecord)
+        assert record['state'] == record.state == 'IL'
+        assert record['name'] == 'Lincoln High School'
+        assert record.get('zip') == '60601'
+        assert record.get('missing') is None
+        assert record[0] == '170000100005'
+        with pytest.raises(KeyError):
+            record['missing']
+
+    def test_records_convert_to_school_dicts(self, nces_df):
+        """Test the dictionary protocol over the school dictionary keys."""
+        record = create_nces_lookup(nces_df)['LINCOLN'][0]
+        expected = _legacy_lookup(nces_df)['LINCOLN'][0]
+        assert 'nces_id' in record and 'state_u' not in record
+        assert list(record.keys()) == list(expected)
+        assert dict(record) == record.to_dict() == expected
+        assert json.loads(json.dumps(record.to_dict())) == expected
+        with pytest.raises(KeyError):
+            record['state_u']
+
+
+class TestMatchToNces:
+    """Tests for match_to_nces function."""
+
+    @pytest.mark.parametrize("name,state,city,expected_id,confidence", [
+        ("Lincoln HS", None, None, '170000100005', 'exact'),
+        ("Central High School", 'IL', None, '060000100001', 'ambiguous'),
+        ("Central H.S.", 'ca', None, '060000100001', 'ambiguous'),
+        ("Central H.S.", 'CA', 'oakland', '060000100002', 'exact'),
+        ("Central", None, 'Dallas', '480000100004', 'exact'),
+        ("St Mary Academy", 'NY', None, '360000100006', 'exact'),
+    ])
+    def test_match(self, nces_df, name, state, city, expected_id, confidence):
+        """Test matching with state and city disambiguation."""
+        match = match_to_nces(name, state, city, nces_lookup=create_nces_lookup(nces_df))
+        assert match['nces_id'] == expected_id
+        assert match['confidence'] == confidence
+
+    def test_no_match(self, nces_df):
+        """Test that unknown and empty names do not match."""
+        lookup = create_nces_lookup(nces_df)
+        assert match_to_nces("Washington HS", nces_lookup=lookup) is None
+        assert match_to_nces("", nces_lookup=lookup) is None
+
+    def test_builds_lookup_from_df(self, nces_df):
+        """Test matching against a DataFrame without a pre-built lookup."""
+        match = match_to_nces("Lincoln HS", nces_df=nces_df)
+        assert match['matched_name'] == 'Lincoln High School'
+        with pytest.raises(ValueError):
+            match_to_nces("Lincoln HS")
+
+    @pytest.mark.parametrize("name,state,city", [
+        ("Lincoln HS", None, None),
+        ("Central High School", 'TX', None),
+        ("Central High School", 'CA', 'Fresno'),
+        ("Central High School", None, None),
+        ("Washington HS", 'CA', None),
+    ])
+    def test_legacy_lookup(self, nces_df, name, state, city):
+        """Test that a dictionary of school dictionaries gives the same matches."""
+        expected = match_to_nces(name, state, city, nces_lookup=create_nces_lookup(nces_df))
+        assert match_to_nces(name, state, city, nces_lookup=_legacy_lookup(nces_df)) == expected
+
+
+class TestBatchMatchToNces:
+    """Tests for batch_match_to_nces function."""
+
+    @pytest.fixture
+    def schools_df(self):
+        return pd.DataFrame({
+            'player': ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J'],
+            'high_school': ['Central HS', 'Central High School', 'Central H.S.', 'Central',
+                            'Lincoln HS', 'St Mary Academy', 'Washington HS', None,
+                            'Central HS', 'Central HS'],
+            'state': ['CA', 'TX', 'IL', None, 'ca', 'NY', 'CA', 'CA', '', 'CA'],
+            'city': ['Oakland', None, 'Austin', 'Dallas', None, None, None, None, 'Fresno', 'Reno'],
+        })
+
+    def test_matches_match_to_nces(self, nces_df, schools_df):
+        """Test that every row matches like match_to_nces does."""
+        result = batch_match_to_nces(schools_df, nces_df=nces_df)
+        lookup = create_nces_lookup(nces_df)
+
+        for row in result.itertuples(index=False):
+            state = row.state if isinstance(row.state, str) else None
+            city = row.city if isinstance(row.city, str) else None
+            name = row.high_school if isinstance(row.high_school, str) else ''
+            expected = match_to_nces(name, state, city, nces_lookup=lookup)
+            if expected is None:
+                assert pd.isna(row.nces_id) and pd.isna(row.nces_confidence)
+            else:
+                assert row.nces_id == expected['nces_id']
+                assert row.nces_matched_name == expected['matched_name']
+                assert row.nces_city == expected['city']
+                assert row.nces_state == expected['state']
+                assert row.nces_confidence == expected['confidence']
+
+    def test_disambiguation(self, nces_df, schools_df):
+        """Test the state, no-state and ambiguous outcomes."""
+        result = batch_match_to_nces(schools_df, nces_df=nces_df).set_index('player')
+        assert result.loc['A', ['nces_id', 'nces_confidence']].tolist() == ['060000100002', 'exact']
+        assert result.loc['B', 'nces_confidence'] == 'ambiguous'
+        assert result.loc['B', 'nces_state'] == 'TX'
+        # No candidates in the state: fall back to every candidate, then city
+        assert result.loc['C', ['nces_id', 'nces_confidence']].tolist() == ['480000100003', 'exact']
+        assert result.loc['D', ['nces_id', 'nces_confidence']].tolist() == ['480000100004', 'exact']
+        # An empty state counts as missing
+        assert result.loc['I', ['nces_id', 'nces_confidence']].tolist() == ['060000100001', 'exact']
+        assert result.loc['J', ['nces_id', 'nces_confidence']].tolist() == ['060000100001', 'ambiguous']
+        assert result.loc[['G', 'H'], 'nces_id'].isna().all()
+
+    def test_columns(self, nces_df, schools_df):
+        """Test that match columns are appended after the input columns."""
+        result = batch_match_to_nces(schools_df, nces_df=nces_df)
+        assert result.columns.tolist() == schools_df.columns.tolist() + [
+            'nces_id', 'nces_matched_name', 'nces_street', 'nces_city',
+            'nces_state', 'nces_zip', 'nces_source', 'nces_confidence',
+        ]
+        assert result.index.equals(schools_df.index)
+        assert 'nces_id' not in schools_df.columns
+
+    def test_without_state_and_city(self, nces_df, schools_df):
+        """Test matching with no disambiguation columns."""
+        result = batch_match_to_nces(schools_df[['high_school']], state_col=None,
+                                     city_col=None, nces_df=nces_df)
+        central = result['high_school'].str.startswith('Central', na=False)
+        assert (result.loc[central, 'nces_confidence'] == 'ambiguous').all()
+        assert (result.loc[central, 'nces_id'] == '060000100001').all()
@@ -0,0 +1,264 @@
+"""
+Tests for web scraping utilities.
+
+Network access is never needed: downloads are mocked.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("newspaper")
+
+from web_scraper import scraper  # noqa: E402
+
+
+class TestSession:
+    """Tests for the HTTP sessions used for downloads."""
+
+    def test_connect_retries_only(self):
+        """Test that only failed connection attempts are retried."""
+        retry = scraper._create_session().get_adapter('https://example.com').max_retries
+        assert retry.connect == 2
+        assert retry.read is False
+        assert retry.status == 0
+        assert not retry.status_forcelist
+
+    def test_session_per_thread(self):
+        """Test that each thread downloads over its own session."""
+        barrier = threading.Barrier(4)
+
+        def session_id(_):
+            barrier.wait()
+            return threading.get_ident(), id(scraper._get_session())
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            pairs = set(executor.map(session_id, range(4)))
+
+        assert len({thread for thread, _ in pairs}) == 4
+        assert len({session for _, session in pairs}) == 4
+        assert scraper._get_session() is scraper._get_session()
+
+
+PAGE = "<html><head><title>Game Recap</title></head><body><article><p>{}</p></article></body></html>"
+
+
+class _FakeResponse:
+    """Stands in for an aiohttp response."""
+
+    def __init__(self, body, charset):
+        self.body = body
+        self.charset = charset
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    async def read(self):
+        return self.body
+
+
+class TestDecodeHtml:
+    """Tests for decoding pages downloaded with aiohttp."""
+
+    def test_header_charset(self):
+        """Test that the charset from the Content-Type header is used."""
+        assert scraper._decode_html('Café'.encode('latin1'), 'iso-8859-1') == 'Café'
+
+    def test_detected_charset(self):
+        """Test that pages without a charset are decoded with the detected encoding."""
+        content = PAGE.format('Un café près du stade, déjà complet.').encode('utf-8')
+        assert scraper._decode_html(content, None) == content.decode('utf-8')
+
+    def test_unknown_charset(self):
+        """Test that an unknown charset falls back to UTF-8."""
+        assert scraper._decode_html('Café'.encode('utf-8'), 'no-such-charset') == 'Café'
+
+
+class TestFetchHtml:
+    """Tests for aiohttp downloads."""
+
+    @pytest.fixture(autouse=True)
+    def _aiohttp(self, monkeypatch):
+        pytest.importorskip("aiohttp")
+        monkeypatch.setattr(scraper, '_RETRY_BACKOFF', 0)
+
+    def _session(self, failures):
+        calls = []
+
+        def get(url, timeout):
+            calls.append(timeout)
+            if len(calls) <= failures:
+                key = SimpleNamespace(host='example.com', port=443, ssl=True)
+                raise scraper.aiohttp.ClientConnectorError(key, OSError("refused"))
+            return _FakeResponse(b'<p>ok</p>', 'utf-8')
+
+        return SimpleNamespace(get=get), calls
+
+    def _fetch(self, session, semaphore=None):
+        async def fetch():
+            return await scraper._fetch_html(session, semaphore or asyncio.Semaphore(1),
+                                             'https://example.com/a', 5)
+
+        return asyncio.run(fetch())
+
+    def test_retries_connection_failures(self):
+        """Test that failed connections are retried like the requests session."""
+        session, calls = self._session(failures=scraper._CONNECT_RETRIES)
+        assert self._fetch(session) == '<p>ok</p>'
+        assert len(calls) == scraper._CONNECT_RETRIES + 1
+
+    def test_gives_up(self):
+        """Test that the connection error is raised once the retries run out."""
+        session, calls = self._session(failures=scraper._CONNECT_RETRIES + 1)
+        with pytest.raises(scraper.aiohttp.ClientConnectorError):
+            self._fetch(session)
+        assert len(calls) == scraper._CONNECT_RETRIES + 1
+
+    def test_timeout_per_socket_operation(self):
+        """Test that the timeout limits connecting and each read, not the whole download."""
+        session, calls = self._session(failures=0)
+        self._fetch(session)
+        assert calls[0].total is None
+        assert calls[0].sock_connect == calls[0].sock_read == 5
+
+    def test_backoff_releases_slot(self, monkeypatch):
+        """Test that no download slot is held while waiting to retry."""
+        semaphore = asyncio.Semaphore(1)
+        held = []
+
+        async def sleep(delay):
+            held.append(semaphore.locked())
+
+        monkeypatch.setattr(scraper.asyncio, 'sleep', sleep)
+        session, _ = self._session(failures=1)
+        assert self._fetch(session, semaphore) == '<p>ok</p>'
+        assert held == [False]
+
+
+class TestExtractArticlesBatch:
+    """Tests for extract_articles_batch function."""
+
+    URLS = ['https://example.com/a', 'https://example.com/fail', 'https://example.com/b']
+
+    def _check(self, results):
+        assert [result['url'] for result in results] == self.URLS
+        assert results[0]['error'] is None and results[2]['error'] is None
+        assert results[1]['error'] == 'download failed' and results[1]['text'] is None
+        assert all('title' in result for result in results)
+
+    def test_async(self, monkeypatch):
+        """Test the aiohttp path with fetching mocked."""
+        aiohttp = pytest.importorskip("aiohttp")
+        headers = []
+        client_session = aiohttp.ClientSession
+
+        def ClientSession(*args, **kwargs):
+            headers.append(kwargs.get('headers'))
+            return client_session(*args, **kwargs)
+
+        async def fetch_html(session, semaphore, url, download_timeout):
+            if 'fail' in url:
+                raise OSError('download failed')
+            return PAGE.format(url)
+
+        monkeypatch.setattr(scraper, 'AIOHTTP_AVAILABLE', True)
+        monkeypatch.setattr(scraper.aiohttp, 'ClientSession', ClientSession)
+        monkeypatch.setattr(scraper, '_fetch_html', fetch_html)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            monkeypatch.setattr(scraper, '_get_parse_pool', lambda: pool)
+            self._check(scraper.extract_articles_batch(self.URLS, include_metadata=True))
+
+        assert headers == [scraper._request_headers()]
+        assert headers[0]['User-Agent'] == scraper._get_session().headers['User-Agent']
+
+    def test_threaded_fallback(self, monkeypatch):
+        """Test the thread pool path used without aiohttp."""
+        def download_html(url, download_timeout):
+            if 'fail' in url:
+                raise OSError('download failed')
+            return PAGE.format(url)
+
+        monkeypatch.setattr(scraper, 'AIOHTTP_AVAILABLE', False)
+        monkeypatch.setattr(scraper, '_download_html', download_html)
+        self._check(scraper.extract_articles_batch(self.URLS, include_metadata=True))
+
+    def test_empty(self):
+        """Test that no URLs give no results."""
+        assert scraper.extract_articles_batch([]) == []
+
+    def test_parse_pool_reused(self):
+        """Test that the parse process pool is shared between calls."""
+        pool = scraper._get_parse_pool()
+        try:
+            assert scraper._get_parse_pool() is pool
+        finally:
+            scraper._discard_parse_pool(pool)
+        assert scraper._PARSE_POOL is None
+
+
+class TestExtractArticleTextFast:
+    """Tests for extract_article_text_fast function."""
+
+    URL = 'https://example.com/recap'
+
+    @pytest.fixture
+    def parsed(self, monkeypatch):
+        """Record the pages handed to the newspaper4k fallback."""
+        calls = []
+
+        def parse_article_html(url, html, include_metadata):
+            calls.append((url, html, include_metadata))
+            return {'url': url, 'error': None, 'text': 'parsed by newspaper4k'}
+
+        monkeypatch.setattr(scraper, '_parse_article_html', parse_article_html)
+        return calls
+
+    def _serve(self, monkeypatch, html):
+        monkeypatch.setattr(scraper, '_download_html', lambda url, download_timeout: html)
+
+    def test_article_element(self, monkeypatch, parsed):
+        """Test that the text comes from <article> with boilerplate stripped."""
+        pytest.importorskip("selectolax")
+        self._serve(monkeypatch, (
+            "<html><body><nav>Home Scores</nav><article><script>track()</script>"
+            "<p>Final score 70-64.</p><aside>Related</aside></article></body></html>"
+        ))
+        result = scraper.extract_article_text_fast(self.URL)
+        assert result == {'url': self.URL, 'error': None, 'text': 'Final score 70-64.'}
+        assert parsed == []
+
+    def test_no_article_element(self, monkeypatch, parsed):
+        """Test that pages without an article element fall back to newspaper4k."""
+        pytest.importorskip("selectolax")
+        html = "<html><body><div><p>Final score 70-64.</p></div></body></html>"
+        self._serve(monkeypatch, html)
+        result = scraper.extract_article_text_fast(self.URL)
+        assert result['text'] == 'parsed by newspaper4k'
+        assert parsed == [(self.URL, html, False)]
+
+    def test_without_selectolax(self, monkeypatch, parsed):
+        """Test that every page is parsed with newspaper4k without selectolax."""
+        monkeypatch.setattr(scraper, 'SELECTOLAX_AVAILABLE', False)
+        self._serve(monkeypatch, PAGE.format('Final score 70-64.'))
+        result = scraper.extract_article_text_fast(self.URL)
+        assert result['text'] == 'parsed by newspaper4k'
+        assert len(parsed) == 1
+
+    def test_download_error(self, monkeypatch, parsed):
+        """Test that a failed download gives the error result."""
+        def download_html(url, download_timeout):
+            raise OSError('connection refused')
+
+        monkeypatch.setattr(scraper, '_download_html', download_html)
+        result = scraper.extract_article_text_fast(self.URL)
+        assert result == {'url': self.URL, 'error': 'connection refused', 'text': None}
+        assert parsed == []
@@ -1,5 +1,5 @@
 """Web scraper utilities using newspaper4k."""
 
-from .scraper import extract_article_text
+from .scraper import extract_article_text, extract_article_text_fast, extract_articles_batch
 
-__all__ = ['extract_article_text']
+__all__ = ['extract_article_text', 'extract_article_text_fast', 'extract_articles_batch']
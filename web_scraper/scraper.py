@@ -5,8 +5,132 @@ This module provides functionality to retrieve and extract text content from
 web articles using the newspaper4k library.
 """
 
-from typing import Optional, Dict
-from newspaper import Article
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from typing import Iterable, List, Optional, Dict
+
+import requests
+from newspaper import Article, Config
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as _HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    try:
+        # selectolax releases before 1.0 only ship the Modest backend
+        from selectolax.parser import HTMLParser as _HTMLParser
+        SELECTOLAX_AVAILABLE = True
+    except ImportError:
+        SELECTOLAX_AVAILABLE = False
+
+
+# Elements that usually hold the article body, tried in this order
+_ARTICLE_SELECTORS = ('article', 'main', '[role=main]')
+
+# Elements dropped (with their content) before taking the article text
+_BOILERPLATE_TAGS = ['script', 'style', 'noscript', 'nav', 'header', 'footer', 'aside', 'form']
+
+# Retries of failed connection attempts, and the backoff factor in seconds
+# between them (doubled after each retry)
+_CONNECT_RETRIES = 2
+_RETRY_BACKOFF = 0.3
+
+
+@lru_cache(maxsize=None)
+def _article_config(request_timeout: int = 10) -> Config:
+    """
+    Return the newspaper4k configuration shared by every Article.
+
+    Only the article text and metadata are used, so images are not fetched
+    for scoring, meta refresh redirects are not followed and nothing is
+    memoized between runs. One configuration is cached per timeout.
+    """
+    config = Config()
+    config.request_timeout = request_timeout
+    config.fetch_images = False
+    config.memoize_articles = False
+    config.follow_meta_refresh = False
+    return config
+
+
+def _request_headers() -> Dict[str, str]:
+    """
+    Headers sent with every article download, with requests and with aiohttp.
+    """
+    return {
+        'User-Agent': _article_config().browser_user_agent,
+        'Accept-Encoding': 'gzip, deflate',
+    }
+
+
+def _create_session() -> requests.Session:
+    """
+    Create an HTTP session for extract_article_text() downloads.
+
+    Reusing a session keeps connections to each host alive between articles
+    instead of paying a new TCP and TLS handshake per URL. Only failed
+    connection attempts are retried: retrying reads or server errors would
+    let one URL take several times download_timeout.
+    """
+    session = requests.Session()
+    session.headers.update(_request_headers())
+
+    retry = Retry(connect=_CONNECT_RETRIES, read=False, status=0, backoff_factor=_RETRY_BACKOFF)
+    adapter = HTTPAdapter(pool_connections=32, max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+
+    return session
+
+
+# requests does not guarantee that a Session is thread-safe, so every thread
+# downloads over its own session
+_THREAD_LOCAL = threading.local()
+
+
+def _get_session() -> requests.Session:
+    """
+    Return the calling thread's HTTP session, creating it on first use.
+    """
+    session = getattr(_THREAD_LOCAL, 'session', None)
+    if session is None:
+        session = _THREAD_LOCAL.session = _create_session()
+    return session
+
+
+def _download_html(url: str, download_timeout: int) -> str:
+    response = _get_session().get(url, timeout=download_timeout)
+    response.raise_for_status()
+
+    # Without a charset header requests assumes ISO-8859-1, so detect it instead
+    if 'charset' not in response.headers.get('Content-Type', '').lower():
+        response.encoding = response.apparent_encoding
+
+    return response.text
+
+
+def _decode_html(content: bytes, charset: Optional[str]) -> str:
+    """
+    Decode a downloaded page like _download_html(): with the charset from the
+    Content-Type header, or else with the encoding detected from the content.
+    """
+    encoding = charset or requests.compat.chardet.detect(content)['encoding']
+    try:
+        return str(content, encoding or 'utf-8', errors='replace')
+    except LookupError:
+        # Unknown encoding name
+        return str(content, 'utf-8', errors='replace')
 
 
 def extract_article_text(
@@ -41,40 +165,250 @@ def extract_article_text(
         >>> print(f"Title: {result['title']}")
         >>> print(f"Text: {result['text']}")
     """
-    result = {'url': url, 'error': None}
-
     try:
         # Create an Article object
-        article = Article(url)
+        article = Article(url, config=_article_config(download_timeout))
 
-        # Download the article
-        article.download()
+        # Download the article over this thread's keep-alive session
+        article.download(input_html=_download_html(url, download_timeout))
 
         # Parse the article
         article.parse()
 
-        # Extract the text
-        result['text'] = article.text
+    except Exception as e:
+        return _error_result(url, e, include_metadata)
+
+    return _article_result(url, article, include_metadata)
 
-        # Include metadata if requested
-        if include_metadata:
-            result['title'] = article.title
-            result['authors'] = article.authors
-            result['publish_date'] = article.publish_date.isoformat() if article.publish_date else None
-            result['top_image'] = article.top_image
 
-    except Exception as e:
-        result['error'] = str(e)
-        result['text'] = None
-        if include_metadata:
-            result['title'] = None
-            result['authors'] = None
-            result['publish_date'] = None
-            result['top_image'] = None
+def _article_result(url: str, article: Article, include_metadata: bool) -> Dict[str, Optional[str]]:
+    """
+    Build the extract_article_text() result for a parsed article.
+    """
+    result = {'url': url, 'error': None}
+
+    # Extract the text
+    result['text'] = article.text
+
+    # Include metadata if requested
+    if include_metadata:
+        result['title'] = article.title
+        result['authors'] = article.authors
+        result['publish_date'] = article.publish_date.isoformat() if article.publish_date else None
+        result['top_image'] = article.top_image
+
+    return result
+
+
+def _error_result(url: str, error: Exception, include_metadata: bool) -> Dict[str, Optional[str]]:
+    """
+    Build the extract_article_text() result for a failed extraction.
+    """
+    result = {'url': url, 'error': str(error)}
+    result['text'] = None
+    if include_metadata:
+        result['title'] = None
+        result['authors'] = None
+        result['publish_date'] = None
+        result['top_image'] = None
 
     return result
 
 
+def _parse_article_html(url: str, html: str, include_metadata: bool) -> Dict[str, Optional[str]]:
+    """
+    Parse already downloaded article HTML, in a worker process for extract_articles_batch().
+    """
+    try:
+        article = Article(url, config=_article_config())
+        article.download(input_html=html)
+        article.parse()
+    except Exception as e:
+        return _error_result(url, e, include_metadata)
+
+    return _article_result(url, article, include_metadata)
+
+
+# Process pool that parses downloaded HTML for extract_articles_batch(),
+# created on first use and shared by later calls
+_PARSE_POOL: Optional[ProcessPoolExecutor] = None
+_PARSE_POOL_LOCK = threading.Lock()
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    global _PARSE_POOL
+    with _PARSE_POOL_LOCK:
+        if _PARSE_POOL is None:
+            _PARSE_POOL = ProcessPoolExecutor()
+        return _PARSE_POOL
+
+
+def _discard_parse_pool(pool: ProcessPoolExecutor):
+    """
+    Drop a broken parse pool (e.g. a worker was killed) so the next call starts a new one.
+    """
+    global _PARSE_POOL
+    with _PARSE_POOL_LOCK:
+        if _PARSE_POOL is pool:
+            _PARSE_POOL = None
+    pool.shutdown(wait=False)
+
+
+async def _fetch_html(session, semaphore: asyncio.Semaphore, url: str, download_timeout: int) -> str:
+    """
+    Download a page with aiohttp, retrying failed connections like the requests session.
+    """
+    # Like the requests timeout: a limit per connection attempt and per read,
+    # not for the whole download
+    timeout = aiohttp.ClientTimeout(sock_connect=download_timeout, sock_read=download_timeout)
+    for attempt in range(_CONNECT_RETRIES + 1):
+        try:
+            async with semaphore:
+                async with session.get(url, timeout=timeout) as response:
+                    response.raise_for_status()
+                    return _decode_html(await response.read(), response.charset)
+        except aiohttp.ClientConnectorError:
+            if attempt == _CONNECT_RETRIES:
+                raise
+        # Back off without holding a download slot
+        await asyncio.sleep(_RETRY_BACKOFF * 2 ** attempt)
+
+
+async def _extract_articles_async(
+    urls: List[str],
+    concurrency: int,
+    download_timeout: int,
+    include_metadata: bool
+) -> List[Dict[str, Optional[str]]]:
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+    pool = _get_parse_pool()
+
+    async with aiohttp.ClientSession(headers=_request_headers()) as session:
+
+        async def extract(url):
+            try:
+                html = await _fetch_html(session, semaphore, url, download_timeout)
+                # HTML parsing is CPU-bound, so it runs outside the event loop
+                return await loop.run_in_executor(
+                    pool, _parse_article_html, url, html, include_metadata
+                )
+            except BrokenProcessPool as e:
+                _discard_parse_pool(pool)
+                return _error_result(url, e, include_metadata)
+            except Exception as e:
+                return _error_result(url, e, include_metadata)
+
+        return list(await asyncio.gather(*(extract(url) for url in urls)))
+
+
+def extract_articles_batch(
+    urls: Iterable[str],
+    concurrency: int = 32,
+    download_timeout: int = 10,
+    include_metadata: bool = False
+) -> List[Dict[str, Optional[str]]]:
+    """
+    Extract text content from many article URLs concurrently.
+
+    With aiohttp installed, up to `concurrency` downloads run at once on an
+    asyncio event loop and the downloaded HTML is parsed in a process pool,
+    which is started on the first call and reused by later calls.
+    Without it, extract_article_text() runs in a pool of `concurrency` threads.
+    Downloads dominate the time for most link sets, so this is much faster
+    than calling extract_article_text() in a loop.
+
+    Must not be called from a running event loop (e.g. inside a coroutine).
+
+    Args:
+        urls: The URLs of the articles to scrape
+        concurrency: Maximum number of downloads in flight at once (default: 32)
+        download_timeout: Timeout in seconds for downloading each article (default: 10)
+        include_metadata: If True, include additional metadata like title, authors,
+                         publish date, and top image (default: False)
+
+    Returns:
+        A list with the extract_article_text() result dictionary for each URL,
+        in the same order as urls
+
+    Example:
+        >>> results = extract_articles_batch(['https://example.com/a', 'https://example.com/b'])
+        >>> for result in results:
+        ...     print(result['url'], result['error'] or len(result['text']))
+    """
+    urls = list(urls)
+    if not urls:
+        return []
+
+    if AIOHTTP_AVAILABLE:
+        return asyncio.run(
+            _extract_articles_async(urls, concurrency, download_timeout, include_metadata)
+        )
+
+    # Fallback: download and parse each URL in a worker thread, each thread
+    # with its own keep-alive session
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(executor.map(
+            lambda url: extract_article_text(url, download_timeout, include_metadata),
+            urls
+        ))
+
+
+def _select_article_text(html: str) -> Optional[str]:
+    """
+    Return the text of the first article-like element in html, or None.
+    """
+    tree = _HTMLParser(html)
+    tree.strip_tags(_BOILERPLATE_TAGS)
+
+    for selector in _ARTICLE_SELECTORS:
+        node = tree.css_first(selector)
+        if node is not None:
+            text = node.text(separator=' ', strip=True)
+            if text:
+                return text
+
+    return None
+
+
+def extract_article_text_fast(url: str, download_timeout: int = 10) -> Dict[str, Optional[str]]:
+    """
+    Extract text content from a web article URL without full newspaper4k parsing.
+
+    When selectolax is installed, the text is taken from the page's first
+    <article>, <main> or role="main" element after dropping scripts,
+    navigation and other boilerplate. This skips newspaper4k's extraction
+    heuristics and is much faster, at the cost of less careful cleanup. Pages
+    without such an element, or any page when selectolax is not installed,
+    are parsed with newspaper4k as in extract_article_text().
+
+    Args:
+        url: The URL of the article to scrape
+        download_timeout: Timeout in seconds for downloading the article (default: 10)
+
+    Returns:
+        A dictionary containing:
+            - 'text': The extracted article text
+            - 'url': The original URL
+            - 'error': Error message if extraction failed
+
+    Example:
+        >>> result = extract_article_text_fast('https://example.com/article')
+        >>> print(result['text'])
+    """
+    try:
+        html = _download_html(url, download_timeout)
+        text = _select_article_text(html) if SELECTOLAX_AVAILABLE else None
+    except Exception as e:
+        return _error_result(url, e, False)
+
+    if text:
+        return {'url': url, 'error': None, 'text': text}
+
+    # Fall back to the full newspaper4k parse of the downloaded page
+    return _parse_article_html(url, html, False)
+
+
 def extract_article_text_simple(url: str) -> Optional[str]:
     """
     Simple wrapper to extract just the text content from a URL.